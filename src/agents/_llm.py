@@ -0,0 +1,124 @@
+"""
+Shared LLM clients for all agents.
+
+Agents used to build a fresh ChatGroq on every call; instead they ask
+this module for a client, which is created once per temperature and
+reused (together with its underlying HTTP connection pool).
+
+All clients send their requests through one pair of keep-alive httpx
+pools (sync and async), so TLS handshakes are paid once per process
+rather than once per client. When ``LLM_REQUESTS_PER_MINUTE`` is set,
+they also share one token-bucket rate limiter, so a burst of tickets is
+spaced out below Groq's limit instead of bouncing off 429s and retrying.
+
+Low-temperature clients (classification, escalation decisions) share an
+in-memory response cache, so repeated tickets skip the Groq round-trip.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Mapping
+
+import httpx
+from langchain_core.caches import InMemoryCache
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_groq import ChatGroq
+
+from src.config import config
+
+
+# Exact-match cache keyed on (rendered prompt, model params)
+_response_cache = InMemoryCache(maxsize=config.LLM_CACHE_SIZE)
+
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=config.LLM_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=config.LLM_HTTP_MAX_KEEPALIVE
+)
+
+
+@lru_cache(maxsize=1)
+def _http_clients():
+    """Create the shared (sync, async) httpx clients on first use."""
+    return httpx.Client(limits=_HTTP_LIMITS), httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+
+@lru_cache(maxsize=1)
+def _rate_limiter():
+    """
+    Create the shared rate limiter on first use.
+
+    Returns None (no throttling) when ``LLM_REQUESTS_PER_MINUTE`` is 0.
+    Only cache misses take a token, so cached answers are never delayed.
+    """
+    if config.LLM_REQUESTS_PER_MINUTE <= 0:
+        return None
+    return InMemoryRateLimiter(
+        requests_per_second=config.LLM_REQUESTS_PER_MINUTE / 60,
+        check_every_n_seconds=0.05,
+        max_bucket_size=1
+    )
+
+
+def _cache_for(temperature: float):
+    """
+    Pick the cache setting for a client.
+
+    Returns the shared cache for deterministic, low-temperature clients
+    and False (caching disabled) for creative ones, where reusing a
+    previous answer would change behaviour.
+    """
+    if config.LLM_CACHE_ENABLED and temperature <= config.LLM_CACHE_MAX_TEMPERATURE:
+        return _response_cache
+    return False
+
+
+@lru_cache(maxsize=None)
+def get_llm(temperature: float) -> ChatGroq:
+    """
+    Return the shared ChatGroq client for the given temperature.
+
+    Call ``get_llm.cache_clear()`` after changing config
+    (or patching ChatGroq) to force new clients to be built; after
+    changing ``LLM_REQUESTS_PER_MINUTE`` clear ``_rate_limiter`` too.
+
+    Args:
+        temperature: Sampling temperature for the client
+
+    Returns:
+        Cached ChatGroq instance
+    """
+    http_client, http_async_client = _http_clients()
+
+    return ChatGroq(
+        model=config.GROQ_MODEL,
+        temperature=temperature,
+        api_key=config.GROQ_API_KEY,
+        max_retries=config.LLM_MAX_RETRIES,
+        rate_limiter=_rate_limiter(),
+        http_client=http_client,
+        http_async_client=http_async_client,
+        cache=_cache_for(temperature)
+    )
+
+
+def chat_messages(
+    system: SystemMessage,
+    user_template: str,
+    values: Mapping[str, Any]
+) -> List[BaseMessage]:
+    """
+    Build the message list for one agent call.
+
+    The system message is created once per agent at import; only the
+    user turn is rendered per ticket, with a plain ``str.format_map``
+    instead of a prompt-template pipeline.
+
+    Args:
+        system: The agent's prebuilt system message
+        user_template: ``str.format`` template for the user turn
+        values: Template fields for this ticket
+
+    Returns:
+        [system, user] messages, ready for ``llm.invoke``
+    """
+    return [system, HumanMessage(content=user_template.format_map(values))]
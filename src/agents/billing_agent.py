@@ -3,40 +3,19 @@ Billing Support Agent - Handles billing and payment issues.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
 
 logger = logging.getLogger(__name__)
 
 
-def billing_support_agent(state: TicketState) -> TicketState:
-    """
-    Handle billing and payment related issues.
-
-    Addresses payments, refunds, subscriptions, invoices, and pricing.
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with billing resolution
-    """
-    logger.info(f"Processing billing support for ticket: {state['ticket_id']}")
-
-    # Initialize LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=config.TEMPERATURE,
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create billing support prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a billing and payment support specialist.
+# Billing support prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a billing and payment support specialist.
 
         Your role:
         1. Address billing questions clearly and professionally
@@ -55,27 +34,44 @@ def billing_support_agent(state: TicketState) -> TicketState:
         - Issue Acknowledgment
         - Explanation/Solution
         - Next Steps
-        - Policy References (if applicable)"""),
-        ("user", """Customer Query: {query}
+        - Policy References (if applicable)"""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Priority: {priority}
 
         FAQ Match: {faq_match}
 
-        Provide billing support resolution:""")
-    ])
+        Provide billing support resolution:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def billing_support_agent(state: TicketState) -> TicketState:
+    """
+    Handle billing and payment related issues.
+
+    Addresses payments, refunds, subscriptions, invoices, and pricing.
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with billing resolution
+    """
+    logger.info(f"Processing billing support for ticket: {state['ticket_id']}")
 
     # Generate billing resolution
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "priority": state.get("priority", "medium"),
         "faq_match": state.get("faq_match", "None")
     })
+    response = get_llm(config.TEMPERATURE).invoke(messages)
 
     resolution = response.content
     state["resolution"] = resolution
-    state["conversation_history"].append(f"[BILLING] Resolution provided")
+    state["conversation_history"].append("[BILLING] Resolution provided")
 
     logger.info("Billing resolution generated")
 
@@ -4,15 +4,57 @@ Routes to appropriate specialized agent.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
-from src.models.state import TicketState, TicketCategory
+from src.models.state import TicketState, TicketCategory, ROUTABLE_CATEGORIES
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
+from src.utils.keywords import compile_keywords
 
 logger = logging.getLogger(__name__)
 
+_VALID_CATEGORIES: Final[frozenset] = frozenset(cat.value for cat in TicketCategory)
+
+_CATEGORY_KEYWORDS = {
+    category: compile_keywords(keywords, whole_word=True)
+    for category, keywords in config.CATEGORY_KEYWORDS.items()
+}
+
+
+# Classification prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a support ticket classifier.
+        Classify customer queries into EXACTLY ONE of these categories:
+
+        1. TECHNICAL - Software issues, bugs, errors, crashes, performance problems, technical difficulties
+        2. BILLING - Payments, invoices, subscriptions, pricing, refunds, charges, billing questions
+        3. GENERAL - Account questions, how-to queries, general information, product inquiries
+
+        Respond with ONLY the category name: TECHNICAL, BILLING, or GENERAL.
+        No other text or explanation."""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
+
+        FAQ Match (if any): {faq_match}
+
+        Classification:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def _classify_by_keywords(query: str) -> str:
+    """
+    Return the category when exactly one keyword bucket matches the
+    query, or "" when none or several do (ambiguous — ask the LLM).
+    """
+    hits = [
+        category
+        for category, pattern in _CATEGORY_KEYWORDS.items()
+        if pattern.search(query)
+    ]
+    return hits[0] if len(hits) == 1 else ""
+
 
 def classifier_agent(state: TicketState) -> TicketState:
     """
@@ -31,44 +73,33 @@ def classifier_agent(state: TicketState) -> TicketState:
     """
     logger.info(f"Classifying ticket: {state['ticket_id']}")
 
-    # Initialize LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=0.1,  # Very low temperature for consistent classification
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create classification prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a support ticket classifier.
-        Classify customer queries into EXACTLY ONE of these categories:
-
-        1. TECHNICAL - Software issues, bugs, errors, crashes, performance problems, technical difficulties
-        2. BILLING - Payments, invoices, subscriptions, pricing, refunds, charges, billing questions
-        3. GENERAL - Account questions, how-to queries, general information, product inquiries
-
-        Respond with ONLY the category name: TECHNICAL, BILLING, or GENERAL.
-        No other text or explanation."""),
-        ("user", """Customer Query: {query}
-
-        FAQ Match (if any): {faq_match}
-
-        Classification:""")
-    ])
+    # Intake already classified the ticket in its LLM call — no second round-trip
+    category = state.get("category", "")
+    if category in ROUTABLE_CATEGORIES:
+        state["conversation_history"].append(f"[CLASSIFIER] Category: {category} (from intake)")
+        logger.info(f"Ticket already classified as: {category}")
+        return state
+
+    # Unambiguous keyword hit — no LLM call needed
+    category = _classify_by_keywords(state["customer_query"])
+    if category:
+        state["category"] = category
+        state["conversation_history"].append(f"[CLASSIFIER] Category: {category} (rules)")
+        logger.info(f"Ticket classified by keywords as: {category}")
+        return state
 
     # Classify the ticket
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "faq_match": state.get("faq_match", "")
     })
+    response = get_llm(0.1).invoke(messages)  # Very low temperature for consistent classification
 
     # Extract and validate category
     category = response.content.strip().upper()
 
     # Validate category
-    valid_categories = [cat.value for cat in TicketCategory]
-    if category not in valid_categories:
+    if category not in _VALID_CATEGORIES:
         logger.warning(f"Invalid category '{category}', defaulting to GENERAL")
         category = TicketCategory.GENERAL.value
 
@@ -3,57 +3,24 @@ Escalation Evaluator Agent - Determines if human intervention is needed.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
+from src.utils.keywords import compile_keywords
+from src.utils.text import clip_text
 
 logger = logging.getLogger(__name__)
 
+# Anchored at word starts: "sue" must not escalate every query about an "issue"
+_ESCALATION_KEYWORDS = compile_keywords(config.ESCALATION_KEYWORDS, word_start=True)
 
-def escalation_evaluator_agent(state: TicketState) -> TicketState:
-    """
-    Evaluate if the ticket needs human escalation.
 
-    Escalation criteria:
-    1. Complex issues requiring human judgment
-    2. Legal or compliance matters
-    3. High-value refund requests
-    4. Frustrated or angry customers
-    5. Issues outside the scope of automated resolution
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with escalation decision
-    """
-    logger.info(f"Evaluating escalation for ticket: {state['ticket_id']}")
-
-    # Check for automatic escalation keywords
-    query_lower = state["customer_query"].lower()
-    auto_escalate = any(
-        keyword in query_lower
-        for keyword in config.ESCALATION_KEYWORDS
-    )
-
-    if auto_escalate:
-        state["needs_escalation"] = True
-        state["conversation_history"].append("[ESCALATION] Auto-escalated based on keywords")
-        logger.info("Ticket auto-escalated based on keywords")
-        return state
-
-    # Use LLM to evaluate escalation need
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=0.2,  # Low temperature for consistent decision-making
-        api_key=config.GROQ_API_KEY
-    )
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an escalation evaluation specialist.
+# Escalation evaluation prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are an escalation evaluation specialist.
 
         Determine if a support ticket needs human escalation based on:
 
@@ -74,23 +41,54 @@ def escalation_evaluator_agent(state: TicketState) -> TicketState:
         - Issues with clear documented solutions
 
         Respond with ONLY one word: ESCALATE or RESOLVE
-        No other text or explanation."""),
-        ("user", """Customer Query: {query}
+        No other text or explanation."""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Category: {category}
         Priority: {priority}
         Proposed Resolution: {resolution}
 
-        Decision:""")
-    ])
+        Decision:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def escalation_evaluator_agent(state: TicketState) -> TicketState:
+    """
+    Evaluate if the ticket needs human escalation.
+
+    Escalation criteria:
+    1. Complex issues requiring human judgment
+    2. Legal or compliance matters
+    3. High-value refund requests
+    4. Frustrated or angry customers
+    5. Issues outside the scope of automated resolution
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with escalation decision
+    """
+    logger.info(f"Evaluating escalation for ticket: {state['ticket_id']}")
+
+    # Check for automatic escalation keywords
+    auto_escalate = _ESCALATION_KEYWORDS.search(state["customer_query"]) is not None
+
+    if auto_escalate:
+        state["needs_escalation"] = True
+        state["conversation_history"].append("[ESCALATION] Auto-escalated based on keywords")
+        logger.info("Ticket auto-escalated based on keywords")
+        return state
 
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "category": state.get("category", "UNKNOWN"),
         "priority": state.get("priority", "medium"),
-        "resolution": state.get("resolution", "")[:500]  # Limit length
+        "resolution": clip_text(state.get("resolution", ""), config.ESCALATION_RESOLUTION_MAX_CHARS)
     })
+    response = get_llm(0.2).invoke(messages)  # Low temperature for consistent decision-making
 
     decision = response.content.strip().upper()
 
@@ -3,44 +3,20 @@ Escalation Response Agent - Creates customer-facing response for escalated ticke
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
+from src.utils.text import clip_text
 
 logger = logging.getLogger(__name__)
 
 
-def escalation_response_agent(state: TicketState) -> TicketState:
-    """
-    Generate a professional, empathetic response for escalated tickets.
-
-    Creates a customer-facing message that:
-    - Acknowledges the issue with empathy
-    - Explains that the ticket is being escalated
-    - Sets clear expectations for human follow-up
-    - Maintains a professional and reassuring tone
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with final_response for escalated ticket
-    """
-    logger.info(f"Generating escalation response for ticket: {state['ticket_id']}")
-
-    # Initialize LLM with higher temperature for more empathetic responses
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=0.7,
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create escalation response prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a professional customer support specialist writing escalation notifications.
+# Escalation response prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a professional customer support specialist writing escalation notifications.
 
         Your task is to create a warm, empathetic message informing the customer their ticket is being escalated to a human specialist.
 
@@ -67,26 +43,50 @@ def escalation_response_agent(state: TicketState) -> TicketState:
         - Defensive or apologetic tone
         - Technical jargon
 
-        Format as a professional email response."""),
-        ("user", """Customer Query: {query}
+        Format as a professional email response."""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Category: {category}
         Priority: {priority}
         Ticket ID: {ticket_id}
         Internal Resolution Notes: {resolution}
 
-        Generate an empathetic escalation notification:""")
-    ])
+        Generate an empathetic escalation notification:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def escalation_response_agent(state: TicketState) -> TicketState:
+    """
+    Generate a professional, empathetic response for escalated tickets.
+
+    Creates a customer-facing message that:
+    - Acknowledges the issue with empathy
+    - Explains that the ticket is being escalated
+    - Sets clear expectations for human follow-up
+    - Maintains a professional and reassuring tone
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with final_response for escalated ticket
+    """
+    logger.info(f"Generating escalation response for ticket: {state['ticket_id']}")
 
     # Generate escalation response
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "category": state.get("category", "GENERAL"),
         "priority": state.get("priority", "medium"),
         "ticket_id": state["ticket_id"],
-        "resolution": state.get("resolution", "Requires specialized review")
+        "resolution": clip_text(
+            state.get("resolution", "Requires specialized review"),
+            config.ESCALATION_RESOLUTION_MAX_CHARS
+        )
     })
+    response = get_llm(0.7).invoke(messages)
 
     final_response = response.content
     state["final_response"] = final_response
@@ -13,16 +13,16 @@ Also doubles as a CLI to manage the FAQ database
 
 import logging
 import sys
+import time
 from difflib import SequenceMatcher
 import certifi
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
 
 from src.config import config
 from src.models.state import TicketState
 
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -30,15 +30,17 @@ logger = logging.getLogger(__name__)
 # DB HELPER
 # =====================================================
 
-# Lazy client — created on first use, not at import time
+# Lazy client — created on first use, not at import time.
+# Synchronous on purpose: the lookup agent runs as a sync graph node and
+# the CLI helpers iterate cursors directly, neither inside an event loop.
 _client = None
 
 
-def _get_client() -> AsyncIOMotorClient:
+def _get_client() -> MongoClient:
     global _client
 
     if _client is None:
-        _client = AsyncIOMotorClient(
+        _client = MongoClient(
             config.MONGO_URI,
             tls=True,
             tlsCAFile=certifi.where(),
@@ -55,13 +57,72 @@ def _get_faq_collection():
     return _get_client()[config.MONGO_DB_NAME][config.FAQ_COLLECTION]
 
 
-def _similarity(a: str, b: str) -> float:
-    """Return a 0-1 similarity score between two strings."""
-    return SequenceMatcher(
-        None,
-        a.lower().strip(),
-        b.lower().strip()
-    ).ratio()
+def load_faq_database() -> dict:
+    """
+    Load every FAQ document from MongoDB in id order.
+
+    Only the lookup agent needs the full set in memory; the CLI
+    helpers below stream from the cursor instead.
+    """
+    try:
+        collection = _get_faq_collection()
+        faqs = list(collection.find({}, {"_id": 0}).sort("id", 1))
+    except Exception as e:
+        logger.error(f"MongoDB error while loading FAQs: {e}")
+        return {"faqs": []}
+
+    return {"faqs": faqs}
+
+
+def stream_faqs():
+    """Yield FAQ documents one at a time, in id order."""
+    collection = _get_faq_collection()
+    for faq in collection.find({}, {"_id": 0}).sort("id", 1):
+        yield faq
+
+
+def max_faq_id() -> int:
+    """Return the highest FAQ id in the collection (0 when empty)."""
+    collection = _get_faq_collection()
+    last = collection.find_one({}, {"_id": 0, "id": 1}, sort=[("id", -1)])
+    return last["id"] if last else 0
+
+
+def _normalize(text: str) -> str:
+    """Lower-case and trim text before similarity scoring."""
+    return text.lower().strip()
+
+
+# (loaded_at, [(normalized question, faq), ...]) — see cached_faqs()
+_faq_cache = None
+
+
+def cached_faqs() -> list:
+    """
+    Return the FAQs as (normalized question, faq) pairs, reloading
+    from MongoDB at most once every FAQ_CACHE_TTL_SECONDS.
+
+    Empty results (including load errors) are not cached, so the
+    next ticket retries the database.
+    """
+    global _faq_cache
+
+    now = time.monotonic()
+    if _faq_cache is not None and now - _faq_cache[0] < config.FAQ_CACHE_TTL_SECONDS:
+        return _faq_cache[1]
+
+    entries = [
+        (_normalize(faq.get("question", "")), faq)
+        for faq in load_faq_database()["faqs"]
+    ]
+    _faq_cache = (now, entries) if entries else None
+    return entries
+
+
+def invalidate_faq_cache() -> None:
+    """Force the next lookup to reload FAQs from MongoDB."""
+    global _faq_cache
+    _faq_cache = None
 
 
 def faq_lookup_agent(state: TicketState) -> TicketState:
@@ -83,12 +144,7 @@ def faq_lookup_agent(state: TicketState) -> TicketState:
         logger.warning(f"[{ticket_id}] Empty query — skipping FAQ lookup")
         return state
 
-    try:
-        collection = _get_faq_collection()
-        faqs = list(collection.find({}, {"_id": 0}))
-    except Exception as e:
-        logger.error(f"[{ticket_id}] MongoDB error during FAQ lookup: {e}")
-        return state
+    faqs = cached_faqs()
 
     if not faqs:
         logger.info(f"[{ticket_id}] FAQ collection is empty")
@@ -97,8 +153,21 @@ def faq_lookup_agent(state: TicketState) -> TicketState:
     best_score = 0.0
     best_faq = None
 
-    for faq in faqs:
-        score = _similarity(query, faq.get("question", ""))
+    # The query side is normalised once; only the FAQ question changes
+    matcher = SequenceMatcher(None, _normalize(query))
+    set_question = matcher.set_seq2
+    real_quick_ratio = matcher.real_quick_ratio
+    quick_ratio = matcher.quick_ratio
+    ratio = matcher.ratio
+
+    for question, faq in faqs:
+        set_question(question)
+
+        # Cheap upper bounds first: skip the full match when it cannot win
+        if real_quick_ratio() <= best_score or quick_ratio() <= best_score:
+            continue
+
+        score = ratio()
         if score > best_score:
             best_score = score
             best_faq = faq
@@ -126,19 +195,31 @@ def faq_lookup_agent(state: TicketState) -> TicketState:
 # FAQ MANAGEMENT (CLI)
 # =====================================================
 
+_CATEGORY_MAP = {"1": "TECHNICAL", "2": "BILLING", "3": "GENERAL"}
+
+_CATEGORY_MENU = "Select category:\n" + "\n".join(
+    f"  {k}. {v}" for k, v in _CATEGORY_MAP.items()
+)
+
+
+def _banner(title: str) -> str:
+    """Return a framed section title, ready for a single print()."""
+    rule = "=" * 80
+    return f"\n{rule}\n{title}\n{rule}\n"
+
+
 def add_faq_entry(category: str, question: str, answer: str) -> bool:
     """Insert a new FAQ document into MongoDB."""
     try:
-        collection = _get_faq_collection()
-        last = collection.find_one(sort=[("id", -1)])
-        new_id = (last["id"] + 1) if last else 1
+        new_id = max_faq_id() + 1
 
-        collection.insert_one({
+        _get_faq_collection().insert_one({
             "id": new_id,
             "category": category.upper(),
             "question": question,
             "answer": answer
         })
+        invalidate_faq_cache()
 
         print(f"\n✅ Successfully added FAQ #{new_id}")
         print(f"   Category : {category.upper()}")
@@ -152,59 +233,50 @@ def add_faq_entry(category: str, question: str, answer: str) -> bool:
 
 
 def list_faqs() -> None:
-    """Print all FAQs from MongoDB."""
+    """Print all FAQs from MongoDB, streaming from the cursor."""
     try:
-        collection = _get_faq_collection()
-        faqs = list(collection.find({}, {"_id": 0}).sort("id", 1))
-    except Exception as e:
-        print(f"❌ MongoDB error: {e}")
-        return
+        total = _get_faq_collection().count_documents({})
 
-    print("\n" + "=" * 80)
-    print(f"FAQ DATABASE — {len(faqs)} entries")
-    print("=" * 80 + "\n")
+        print(_banner(f"FAQ DATABASE — {total} entries"))
 
-    for faq in faqs:
-        preview = (
-            faq["answer"][:100] + "..."
-            if len(faq["answer"]) > 100
-            else faq["answer"]
-        )
-        print(f"[{faq['id']}] {faq['category']}")
-        print(f"  Q: {faq['question']}")
-        print(f"  A: {preview}")
-        print()
+        for faq in stream_faqs():
+            answer = faq["answer"]
+            if len(answer) > 100:
+                answer = answer[:100] + "..."
+            sys.stdout.write(
+                f"[{faq['id']}] {faq['category']}\n"
+                f"  Q: {faq['question']}\n"
+                f"  A: {answer}\n\n"
+            )
+
+    except Exception as e:
+        print(f"❌ MongoDB error: {e}")
 
 
 def interactive_add() -> bool:
     """Prompt the user to fill in a new FAQ entry."""
-    print("\n" + "=" * 80)
-    print("ADD FAQ ENTRY — INTERACTIVE MODE")
-    print("=" * 80 + "\n")
+    print(_banner("ADD FAQ ENTRY — INTERACTIVE MODE"))
 
-    category_map = {"1": "TECHNICAL", "2": "BILLING", "3": "GENERAL"}
-
-    print("Select category:")
-    for k, v in category_map.items():
-        print(f"  {k}. {v}")
+    print(_CATEGORY_MENU)
 
     while True:
         choice = input("\nEnter choice (1-3): ").strip()
-        if choice in category_map:
-            category = category_map[choice]
+        category = _CATEGORY_MAP.get(choice)
+        if category:
             break
         print("  Invalid — please enter 1, 2, or 3.")
 
     question = input(f"\n[{category}] Question: ").strip()
     answer   = input(f"[{category}] Answer  : ").strip()
 
-    print("\n" + "-" * 80)
-    print("Preview:")
-    print("-" * 80)
-    print(f"  Category : {category}")
-    print(f"  Question : {question}")
-    print(f"  Answer   : {answer}")
-    print("-" * 80)
+    rule = "-" * 80
+    print(
+        f"\n{rule}\nPreview:\n{rule}\n"
+        f"  Category : {category}\n"
+        f"  Question : {question}\n"
+        f"  Answer   : {answer}\n"
+        f"{rule}"
+    )
 
     if input("\nAdd this FAQ entry? (y/n): ").strip().lower() == "y":
         return add_faq_entry(category, question, answer)
@@ -218,6 +290,11 @@ def interactive_add() -> bool:
 # =====================================================
 
 def _cli() -> None:
+    try:
+        import readline  # noqa: F401  (line editing / paste for input())
+    except ImportError:
+        pass
+
     args = sys.argv[1:]
 
     if not args:
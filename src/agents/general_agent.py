@@ -3,40 +3,19 @@ General Support Agent - Handles general inquiries.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
 
 logger = logging.getLogger(__name__)
 
 
-def general_support_agent(state: TicketState) -> TicketState:
-    """
-    Handle general support inquiries.
-
-    Addresses how-to questions, account management, and general information.
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with general resolution
-    """
-    logger.info(f"Processing general support for ticket: {state['ticket_id']}")
-
-    # Initialize LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=config.TEMPERATURE,
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create general support prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a friendly and knowledgeable general support specialist.
+# General support prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a friendly and knowledgeable general support specialist.
 
         Your role:
         1. Answer general questions about products and services
@@ -55,27 +34,44 @@ def general_support_agent(state: TicketState) -> TicketState:
         - Direct Answer to Question
         - Step-by-Step Instructions (if applicable)
         - Additional Resources
-        - Follow-up Suggestions"""),
-        ("user", """Customer Query: {query}
+        - Follow-up Suggestions"""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Priority: {priority}
 
         FAQ Match: {faq_match}
 
-        Provide general support resolution:""")
-    ])
+        Provide general support resolution:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def general_support_agent(state: TicketState) -> TicketState:
+    """
+    Handle general support inquiries.
+
+    Addresses how-to questions, account management, and general information.
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with general resolution
+    """
+    logger.info(f"Processing general support for ticket: {state['ticket_id']}")
 
     # Generate general resolution
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "priority": state.get("priority", "medium"),
         "faq_match": state.get("faq_match", "None")
     })
+    response = get_llm(config.TEMPERATURE).invoke(messages)
 
     resolution = response.content
     state["resolution"] = resolution
-    state["conversation_history"].append(f"[GENERAL] Resolution provided")
+    state["conversation_history"].append("[GENERAL] Resolution provided")
 
     logger.info("General resolution generated")
 
@@ -1,42 +1,55 @@
 """
 Ticket Intake Agent - First agent in the workflow.
 Receives customer queries and extracts key information.
+
+The same LLM call also proposes a category, so the classifier
+can skip its own round-trip when the FAQ lookup misses.
 """
 
 import logging
 from datetime import datetime
+from typing import Final, Tuple
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+import orjson
+from langchain_core.messages import SystemMessage
 
-from src.models.state import TicketState
+from src.models.state import TicketState, ROUTABLE_CATEGORIES
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
+from src.utils.keywords import compile_keywords
 
 logger = logging.getLogger(__name__)
 
+_HIGH_PRIORITY_KEYWORDS = compile_keywords(config.HIGH_PRIORITY_KEYWORDS)
+_LOW_PRIORITY_KEYWORDS = compile_keywords(config.LOW_PRIORITY_KEYWORDS)
 
-def intake_agent(state: TicketState) -> TicketState:
-    """
-    Process incoming customer query and extract key information.
 
-    Args:
-        state: Current ticket state
+def _parse_triage(content: str) -> Tuple[str, str]:
+    """
+    Split the intake LLM reply into (summary, category).
 
-    Returns:
-        Updated state with extracted information
+    Falls back to treating the whole reply as the summary (with no
+    category) when it is not the expected JSON object.
     """
-    logger.info(f"Processing ticket intake for: {state['ticket_id']}")
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end <= start:
+        return content, ""
+
+    try:
+        data = orjson.loads(content[start:end + 1])
+    except orjson.JSONDecodeError:
+        return content, ""
+
+    if not isinstance(data, dict):
+        return content, ""
 
-    # Initialize the LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=config.TEMPERATURE,
-        api_key=config.GROQ_API_KEY
-    )
+    summary = str(data.get("summary") or content).strip()
+    category = str(data.get("category") or "").strip().upper()
+    return summary, category
 
-    # Create the intake prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a customer support intake specialist.
+
+# Intake prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a customer support intake specialist.
         Extract and summarize the key information from customer queries.
         Identify:
         1. Main issue or question
@@ -44,29 +57,56 @@ def intake_agent(state: TicketState) -> TicketState:
         3. Urgency level (low, medium, high)
         4. Customer sentiment (positive, neutral, negative)
 
-        Provide a concise summary of the customer's needs."""),
-        ("user", "Customer Query: {query}")
-    ])
+        Also classify the query into EXACTLY ONE category:
+        TECHNICAL (software issues, bugs, errors, crashes, performance),
+        BILLING (payments, invoices, subscriptions, pricing, refunds, charges) or
+        GENERAL (account questions, how-to queries, general information).
+
+        Respond with ONLY a JSON object:
+        {"summary": "<concise summary of the customer's needs>", "category": "<TECHNICAL|BILLING|GENERAL>"}"""
+
+_USER_TEMPLATE: Final[str] = "Customer Query: {query}"
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def intake_agent(state: TicketState) -> TicketState:
+    """
+    Process incoming customer query and extract key information.
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with extracted information
+    """
+    logger.info(f"Processing ticket intake for: {state['ticket_id']}")
 
     # Process the query
-    chain = prompt | llm
-    response = chain.invoke({"query": state["customer_query"]})
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {"query": state["customer_query"]})
+    # Low temperature: the reply also carries a classification
+    response = get_llm(0.1).invoke(messages)
 
     # Update state
-    intake_summary = response.content
+    intake_summary, category = _parse_triage(response.content)
     state["conversation_history"].append(f"[INTAKE] {intake_summary}")
 
+    if category in ROUTABLE_CATEGORIES and not state.get("category"):
+        state["category"] = category
+
     # Determine priority based on keywords
     priority = "medium"
-    query_lower = state["customer_query"].lower()
+    query = state["customer_query"]
 
-    if any(keyword in query_lower for keyword in ["urgent", "critical", "asap", "emergency"]):
+    if _HIGH_PRIORITY_KEYWORDS.search(query):
         priority = "high"
-    elif any(keyword in query_lower for keyword in ["question", "wondering", "curious"]):
+    elif _LOW_PRIORITY_KEYWORDS.search(query):
         priority = "low"
 
     state["priority"] = priority
-    state["timestamp"] = datetime.now().isoformat()
+    # The API stamps tickets on creation; only fill in for direct callers
+    if not state.get("timestamp"):
+        state["timestamp"] = datetime.now().isoformat()
 
     logger.info(f"Intake complete - Priority: {priority}")
 
@@ -3,40 +3,19 @@ Response Generator Agent - Creates final customer response.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
 
 logger = logging.getLogger(__name__)
 
 
-def response_generator_agent(state: TicketState) -> TicketState:
-    """
-    Generate the final customer-facing response.
-
-    Creates a professional, empathetic response based on the resolution.
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with final response
-    """
-    logger.info(f"Generating final response for ticket: {state['ticket_id']}")
-
-    # Initialize LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=0.7,
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create response generation prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are a professional customer support response writer.
+# Response generation prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are a professional customer support response writer.
 
         Your task is to create a polished, customer-facing response based on the resolution provided.
 
@@ -58,24 +37,66 @@ def response_generator_agent(state: TicketState) -> TicketState:
         - Technical jargon (unless necessary)
         - Overly formal or robotic language
         - Making promises you can't keep
-        - Generic template responses"""),
-        ("user", """Customer Query: {query}
+        - Generic template responses"""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Category: {category}
         Ticket ID: {ticket_id}
         Resolution: {resolution}
 
-        Generate final customer response:""")
-    ])
+        Generate final customer response:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+# Reply for tickets answered straight from the FAQ (no LLM call)
+_FAQ_RESPONSE_TEMPLATE: Final[str] = """Hello,
+
+Thank you for contacting us.
+
+{answer}
+
+If you need any further help, just reply to this message and we'll be happy to assist.
+
+Ticket ID: {ticket_id}
+
+Best regards,
+Customer Support Team"""
+
+
+def response_generator_agent(state: TicketState) -> TicketState:
+    """
+    Generate the final customer-facing response.
+
+    Creates a professional, empathetic response based on the resolution.
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with final response
+    """
+    logger.info(f"Generating final response for ticket: {state['ticket_id']}")
+
+    # FAQ hit with no specialist resolution: the FAQ answer is the reply
+    faq_match = state.get("faq_match", "")
+    if config.FAQ_DIRECT_RESPONSE and faq_match and not state.get("resolution"):
+        state["final_response"] = _FAQ_RESPONSE_TEMPLATE.format_map({
+            "answer": faq_match,
+            "ticket_id": state["ticket_id"]
+        })
+        state["conversation_history"].append("[RESPONSE] Final response generated (FAQ)")
+        logger.info(f"FAQ response sent for ticket: {state['ticket_id']}")
+        return state
 
     # Generate final response
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "category": state.get("category", "GENERAL"),
         "ticket_id": state["ticket_id"],
         "resolution": state.get("resolution", "We're looking into this for you.")
     })
+    response = get_llm(0.7).invoke(messages)
 
     final_response = response.content
     state["final_response"] = final_response
@@ -3,40 +3,19 @@ Technical Support Agent - Handles technical issues.
 """
 
 import logging
+from typing import Final
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
 
 from src.models.state import TicketState
 from src.config import config
+from src.agents._llm import chat_messages, get_llm
 
 logger = logging.getLogger(__name__)
 
 
-def technical_support_agent(state: TicketState) -> TicketState:
-    """
-    Handle technical support issues.
-
-    Provides troubleshooting steps, technical solutions, and workarounds.
-
-    Args:
-        state: Current ticket state
-
-    Returns:
-        Updated state with technical resolution
-    """
-    logger.info(f"Processing technical support for ticket: {state['ticket_id']}")
-
-    # Initialize LLM
-    llm = ChatGroq(
-        model=config.GROQ_MODEL,
-        temperature=config.TEMPERATURE,
-        api_key=config.GROQ_API_KEY
-    )
-
-    # Create technical support prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an expert technical support specialist.
+# Technical support prompt, compiled once at import
+_SYSTEM_PROMPT: Final[str] = """You are an expert technical support specialist.
 
         Your role:
         1. Analyze technical issues systematically
@@ -51,27 +30,44 @@ def technical_support_agent(state: TicketState) -> TicketState:
         - Problem Summary
         - Troubleshooting Steps (numbered)
         - Expected Resolution
-        - Additional Notes (if any)"""),
-        ("user", """Customer Query: {query}
+        - Additional Notes (if any)"""
+
+_USER_TEMPLATE: Final[str] = """Customer Query: {query}
 
         Priority: {priority}
 
         FAQ Match: {faq_match}
 
-        Provide technical support resolution:""")
-    ])
+        Provide technical support resolution:"""
+
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def technical_support_agent(state: TicketState) -> TicketState:
+    """
+    Handle technical support issues.
+
+    Provides troubleshooting steps, technical solutions, and workarounds.
+
+    Args:
+        state: Current ticket state
+
+    Returns:
+        Updated state with technical resolution
+    """
+    logger.info(f"Processing technical support for ticket: {state['ticket_id']}")
 
     # Generate technical resolution
-    chain = prompt | llm
-    response = chain.invoke({
+    messages = chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {
         "query": state["customer_query"],
         "priority": state.get("priority", "medium"),
         "faq_match": state.get("faq_match", "None")
     })
+    response = get_llm(config.TEMPERATURE).invoke(messages)
 
     resolution = response.content
     state["resolution"] = resolution
-    state["conversation_history"].append(f"[TECHNICAL] Resolution provided")
+    state["conversation_history"].append("[TECHNICAL] Resolution provided")
 
     logger.info("Technical resolution generated")
 
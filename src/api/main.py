@@ -4,18 +4,21 @@ Every processed ticket is stored in MongoDB for full traceability.
 """
 
 import logging
+import time
 import uuid
 from datetime import datetime
 from typing import Optional, List
 
+import orjson
 from pymongo import MongoClient
 from motor.motor_asyncio import AsyncIOMotorClient
 import certifi
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict
 
-from src.workflow import app as workflow_app
+from src.workflow import get_app
 from src.config import config
 from src.utils.logger import setup_logging
 from src.utils.metrics import TicketMetrics
@@ -26,7 +29,8 @@ logger = logging.getLogger(__name__)
 api_app = FastAPI(
     title="Customer Support Ticket Management System",
     description="Multi-Agent AI System for automating customer support ticket processing",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 api_app.add_middleware(
@@ -39,6 +43,8 @@ api_app.add_middleware(
 
 metrics = TicketMetrics()
 
+workflow_app = get_app()
+
 # =====================================================
 # MONGODB
 # =====================================================
@@ -64,10 +70,16 @@ def get_tickets_collection():
     return _mongo_client[config.MONGO_DB_NAME][config.TICKETS_COLLECTION]
 
 
-def save_ticket(result: dict, processing_time: float) -> None:
+def recent_history(result: dict) -> List[str]:
+    """Return the last MAX_CONVERSATION_HISTORY conversation entries."""
+    return result.get("conversation_history", [])[-config.MAX_CONVERSATION_HISTORY:]
+
+
+async def save_ticket(result: dict, processing_time: float) -> None:
     """Persist the full ticket state to MongoDB."""
     try:
         collection = get_tickets_collection()
+        saved_at = datetime.now().isoformat()
         doc = {
             "ticket_id":            result["ticket_id"],
             "customer_query":       result["customer_query"],
@@ -78,13 +90,13 @@ def save_ticket(result: dict, processing_time: float) -> None:
             "resolution":           result.get("resolution", ""),
             "needs_escalation":     result["needs_escalation"],
             "final_response":       result["final_response"],
-            "conversation_history": result.get("conversation_history", []),
+            "conversation_history": recent_history(result),
             "metadata":             result.get("metadata", {}),
             "processing_time_sec":  round(processing_time, 3),
-            "created_at":           result.get("timestamp", datetime.now().isoformat()),
-            "saved_at":             datetime.now().isoformat(),
+            "created_at":           result.get("timestamp") or saved_at,
+            "saved_at":             saved_at,
         }
-        collection.insert_one(doc)
+        await collection.insert_one(doc)
         logger.info(f"Ticket {result['ticket_id']} saved to MongoDB")
     except Exception as e:
         logger.error(f"Failed to save ticket {result.get('ticket_id')}: {e}")
@@ -144,6 +156,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "process_ticket": "/api/v1/tickets/process",
+            "process_stream": "/api/v1/tickets/process/stream",
             "get_ticket":     "/api/v1/tickets/{ticket_id}",
             "list_tickets":   "/api/v1/tickets",
             "health":         "/health",
@@ -161,51 +174,76 @@ async def health_check():
     )
 
 
+def build_initial_state(request: TicketRequest) -> dict:
+    """Create the initial workflow state for an incoming ticket."""
+    ticket_id = request.ticket_id or f"{config.TICKET_ID_PREFIX}-{uuid.uuid4().hex[:8].upper()}"
+
+    return {
+        "customer_query":       request.customer_query,
+        "ticket_id":            ticket_id,
+        "category":             "",
+        "faq_match":            "",
+        "resolution":           "",
+        "needs_escalation":     False,
+        "final_response":       "",
+        "conversation_history": [],
+        "customer_email":       request.customer_email,
+        "priority":             "medium",
+        "timestamp":            datetime.now().isoformat(),
+        "metadata":             {}
+    }
+
+
+async def record_result(result: dict, processing_time: float) -> None:
+    """Persist a processed ticket and update the in-memory metrics."""
+    # ── Save to MongoDB ──
+    await save_ticket(result, processing_time)
+
+    # ── Update in-memory metrics ──
+    metrics.record_ticket(
+        category=result["category"],
+        escalated=result["needs_escalation"],
+        response_time=processing_time
+    )
+
+    logger.info(
+        f"Ticket {result['ticket_id']} processed — "
+        f"category={result['category']}, "
+        f"escalated={result['needs_escalation']}, "
+        f"time={processing_time:.2f}s"
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+# Nodes whose LLM tokens are the customer-facing reply
+STREAMED_NODES = frozenset({"response_gen", "escalation_response"})
+
+
 @api_app.post("/api/v1/tickets/process", response_model=TicketResponse)
-async def process_ticket(request: TicketRequest):
+async def process_ticket(request: TicketRequest, background_tasks: BackgroundTasks):
     """
     Process a support ticket through the multi-agent workflow
     and persist the full conversation to MongoDB.
+
+    Persistence and metrics run as a background task after the
+    response has been sent, so they add no latency for the caller.
     """
     try:
-        ticket_id = request.ticket_id or f"{config.TICKET_ID_PREFIX}-{uuid.uuid4().hex[:8].upper()}"
-        logger.info(f"Processing new ticket: {ticket_id}")
-
-        initial_state = {
-            "customer_query":       request.customer_query,
-            "ticket_id":            ticket_id,
-            "category":             "",
-            "faq_match":            "",
-            "resolution":           "",
-            "needs_escalation":     False,
-            "final_response":       "",
-            "conversation_history": [],
-            "customer_email":       request.customer_email,
-            "priority":             "medium",
-            "timestamp":            datetime.now().isoformat(),
-            "metadata":             {}
-        }
-
-        start_time = datetime.now()
-        result = workflow_app.invoke(initial_state)
-        processing_time = (datetime.now() - start_time).total_seconds()
+        initial_state = build_initial_state(request)
+        logger.info(f"Processing new ticket: {initial_state['ticket_id']}")
 
-        # ── Save to MongoDB ──
-        save_ticket(result, processing_time)
+        start_time = time.perf_counter()
+        # The workflow runs asynchronously (sync agent nodes go to worker
+        # threads), so concurrent tickets overlap their LLM calls over the
+        # shared ChatGroq clients while the event loop serves other requests
+        result = await workflow_app.ainvoke(initial_state)
+        processing_time = time.perf_counter() - start_time
 
-        # ── Update in-memory metrics ──
-        metrics.record_ticket(
-            category=result["category"],
-            escalated=result["needs_escalation"],
-            response_time=processing_time
-        )
-
-        logger.info(
-            f"Ticket {ticket_id} processed — "
-            f"category={result['category']}, "
-            f"escalated={result['needs_escalation']}, "
-            f"time={processing_time:.2f}s"
-        )
+        background_tasks.add_task(record_result, result, processing_time)
 
         return TicketResponse(
             ticket_id=result["ticket_id"],
@@ -214,7 +252,7 @@ async def process_ticket(request: TicketRequest):
             needs_escalation=result["needs_escalation"],
             priority=result["priority"],
             timestamp=result["timestamp"],
-            conversation_history=result["conversation_history"]
+            conversation_history=recent_history(result)
         )
 
     except Exception as e:
@@ -222,6 +260,60 @@ async def process_ticket(request: TicketRequest):
         raise HTTPException(status_code=500, detail=f"Error processing ticket: {e}")
 
 
+@api_app.post("/api/v1/tickets/process/stream")
+async def process_ticket_stream(request: TicketRequest):
+    """
+    Process a support ticket and stream the final response as
+    server-sent events.
+
+    Emits ``token`` events while the response (or escalation notice)
+    is being generated, then a single ``done`` event carrying the
+    ticket metadata, or an ``error`` event on failure.
+    """
+    initial_state = build_initial_state(request)
+    logger.info(f"Processing new ticket (streaming): {initial_state['ticket_id']}")
+
+    async def event_stream():
+        start_time = time.perf_counter()
+        result = initial_state
+        streamed = False
+
+        try:
+            async for mode, chunk in workflow_app.astream(
+                initial_state,
+                stream_mode=["messages", "values"]
+            ):
+                if mode == "values":
+                    result = chunk
+                    continue
+
+                message, meta = chunk
+                if meta.get("langgraph_node") in STREAMED_NODES and message.content:
+                    streamed = True
+                    yield _sse("token", {"content": message.content})
+
+            # Replies built without the LLM (FAQ answers) arrive in one piece
+            if not streamed and result.get("final_response"):
+                yield _sse("token", {"content": result["final_response"]})
+
+            processing_time = time.perf_counter() - start_time
+            await record_result(result, processing_time)
+
+            yield _sse("done", {
+                "ticket_id":        result["ticket_id"],
+                "category":         result["category"],
+                "needs_escalation": result["needs_escalation"],
+                "priority":         result["priority"],
+                "timestamp":        result["timestamp"],
+            })
+
+        except Exception as e:
+            logger.error(f"Error streaming ticket: {e}", exc_info=True)
+            yield _sse("error", {"detail": f"Error processing ticket: {e}"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @api_app.get("/api/v1/tickets/{ticket_id}")
 async def get_ticket(ticket_id: str):
     """Retrieve a single ticket by ID from MongoDB."""
@@ -268,7 +360,7 @@ async def list_tickets(
 @api_app.get("/api/v1/metrics", response_model=MetricsResponse)
 async def get_metrics():
     try:
-        data = metrics.get_metrics()
+        data = metrics.get_metrics(pretty=True)
         return MetricsResponse(
             total_tickets=data["total_tickets"],
             escalated_tickets=data["escalated_tickets"],
@@ -17,8 +17,22 @@ class Config:
     GROQ_MODEL = os.getenv("GROQ_MODEL",)
     TEMPERATURE = float(os.getenv("TEMPERATURE", 0.7))
 
+    # LLM Response Cache (exact-match, only for low-temperature agents)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+    LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.3"))
+
+    # Groq HTTP connection pool (shared by every LLM client)
+    LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+    LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "50"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    # Client-side request throttle shared by every LLM client (0 = unlimited)
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))
+
   
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Write log records from a background thread instead of the caller
+    LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "false").lower() == "true"
     # Escalation Thresholds
     ESCALATION_KEYWORDS = [
         "lawsuit",
@@ -33,7 +47,28 @@ class Config:
         "unacceptable",
     ]
 
+    # Priority Keywords (checked by the intake agent)
+    HIGH_PRIORITY_KEYWORDS = ["urgent", "critical", "asap", "emergency"]
+    LOW_PRIORITY_KEYWORDS = ["question", "wondering", "curious"]
+
+    # Category Keywords (rule-based classifier fast path; a ticket is
+    # classified without the LLM only when exactly one category matches).
+    # Whole words only; a trailing * marks a stem that may take any suffix
+    CATEGORY_KEYWORDS = {
+        "TECHNICAL": [
+            "crash", "crashes", "crashed", "crashing",
+            "error", "errors", "bug", "bugs", "buggy",
+            "freez*", "frozen",
+        ],
+        "BILLING": [
+            "refund*", "invoice*", "charge", "charges", "charged",
+            "billing", "payment*", "subscription*",
+        ],
+    }
+
     CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", 0.7))
+    # Longest resolution excerpt sent to the escalation prompts
+    ESCALATION_RESOLUTION_MAX_CHARS = int(os.getenv("ESCALATION_RESOLUTION_MAX_CHARS", "500"))
 
     # FAQ Configuration
    # MongoDB Configuration
@@ -46,6 +81,10 @@ class Config:
 
    
     FAQ_SIMILARITY_THRESHOLD = float(os.getenv("FAQ_SIMILARITY_THRESHOLD", "0.75"))
+    # Seconds the lookup agent reuses its in-memory FAQ copy (0 disables)
+    FAQ_CACHE_TTL_SECONDS = float(os.getenv("FAQ_CACHE_TTL_SECONDS", "300"))
+    # Send FAQ answers with a fixed wrapper instead of an LLM rewrite
+    FAQ_DIRECT_RESPONSE = os.getenv("FAQ_DIRECT_RESPONSE", "true").lower() == "true"
 
     # API Configuration
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -1,5 +1,5 @@
 """State models for the ticket management system."""
 
-from .state import TicketState, TicketCategory
+from .state import TicketState, TicketCategory, ROUTABLE_CATEGORIES
 
-__all__ = ["TicketState", "TicketCategory"]
+__all__ = ["TicketState", "TicketCategory", "ROUTABLE_CATEGORIES"]
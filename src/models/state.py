@@ -14,6 +14,14 @@ class TicketCategory(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Categories a ticket can be routed on (UNKNOWN is not routable)
+ROUTABLE_CATEGORIES = frozenset({
+    TicketCategory.TECHNICAL.value,
+    TicketCategory.BILLING.value,
+    TicketCategory.GENERAL.value,
+})
+
+
 class TicketState(TypedDict):
     """
     State structure that flows through the multi-agent system.
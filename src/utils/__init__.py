@@ -2,5 +2,7 @@
 
 from .logger import setup_logging
 from .metrics import TicketMetrics
+from .keywords import compile_keywords
+from .text import clip_text
 
-__all__ = ["setup_logging", "TicketMetrics"]
+__all__ = ["setup_logging", "TicketMetrics", "compile_keywords", "clip_text"]
@@ -8,10 +8,49 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from src.config import config
 import certifi
 
+
+def resequence_ids(collection) -> int:
+    """
+    Renumber FAQ ids to 1..N in current id order.
+
+    Works in two passes so the unique index on ``id`` never sees two
+    documents share a value mid-way: every document that has to move is
+    first parked on a temporary negative id below anything in use, then
+    given its final id. Documents already in place are not touched.
+
+    Returns:
+        Number of documents whose id changed
+    """
+    docs = list(collection.find({}, {"id": 1}).sort("id", 1))
+    moves = [
+        (doc["_id"], i + 1)
+        for i, doc in enumerate(docs)
+        if doc.get("id") != i + 1
+    ]
+    if not moves:
+        return 0
+
+    numeric_ids = [
+        doc["id"] for doc in docs
+        if isinstance(doc.get("id"), (int, float)) and not isinstance(doc.get("id"), bool)
+    ]
+    parking = min(min(numeric_ids, default=0), 0) - 1
+
+    collection.bulk_write([
+        UpdateOne({"_id": _id}, {"$set": {"id": parking - n}})
+        for n, (_id, _) in enumerate(moves)
+    ], ordered=True)
+    collection.bulk_write([
+        UpdateOne({"_id": _id}, {"$set": {"id": new_id}})
+        for _id, new_id in moves
+    ], ordered=True)
+    return len(moves)
+
+
 def main():
     client = MongoClient(config.MONGO_URI ,tls=True,tlsAllowInvalidCertificates=True,tlsCAFile=certifi.where())
     db = client[config.MONGO_DB_NAME]
@@ -29,11 +68,14 @@ def main():
         return
 
     # Print all records
+    # One write per record instead of four
     for doc in collection.find().sort("id", 1):
-        print(f"[{doc.get('id', '?')}] {doc.get('category', '?')}")
-        print(f"  Q : {doc.get('question', '—')}")
-        print(f"  A : {doc.get('answer', '—')[:120]}")
-        print()
+        sys.stdout.write(
+            f"[{doc.get('id', '?')}] {doc.get('category', '?')}\n"
+            f"  Q : {doc.get('question', '—')}\n"
+            f"  A : {doc.get('answer', '—')[:120]}\n\n"
+        )
+    sys.stdout.flush()
 
     # Check for missing required fields
     bad = list(collection.find({
@@ -58,13 +100,12 @@ def main():
         print("✅ All records look healthy.")
 
     # Re-sequence IDs if gaps exist
-    all_docs = list(collection.find().sort("id", 1))
-    needs_reseq = any(doc.get('id') != i+1 for i, doc in enumerate(all_docs))
-    if needs_reseq:
-        print("\n⚠️  ID sequence has gaps. Re-sequencing...")
-        for i, doc in enumerate(all_docs):
-            collection.update_one({"_id": doc["_id"]}, {"$set": {"id": i+1}})
-        print("✅ IDs re-sequenced.")
+    moved = resequence_ids(collection)
+    if moved:
+        print(f"\n✅ ID sequence had gaps; re-sequenced {moved} record(s).")
+
+    # Same unique index seed_faqs builds; only safe once ids are 1..N
+    collection.create_index("id", unique=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+"""
+Keyword matching helpers shared by the agents.
+"""
+
+import re
+from typing import Iterable, Pattern
+
+
+def compile_keywords(
+    keywords: Iterable[str],
+    word_start: bool = False,
+    whole_word: bool = False
+) -> Pattern[str]:
+    """
+    Compile a keyword list into a single alternation regex.
+
+    ``pattern.search(text)`` is equivalent to
+    ``any(keyword in text.lower() for keyword in keywords)`` but runs as
+    one case-insensitive C-level scan of the original text, with no
+    lower-cased copy and no Python loop of substring checks.
+    Longer keywords are tried first so overlapping entries behave
+    predictably when the match itself is inspected.
+
+    Args:
+        keywords: Lower-case keywords or phrases
+        word_start: Only match where a word begins, so e.g. "sue"
+            does not fire inside "issue" or "pursue", while plurals and
+            inflections ("lawyers", "legal actions") still match
+        whole_word: Only match complete words, so "charge" does not fire
+            inside "recharged" or "discharge". A keyword ending in ``*``
+            is a stem that matches any word it begins ("freez*" matches
+            "freezes" and "freezing")
+
+    Returns:
+        Compiled pattern (matches nothing if ``keywords`` is empty)
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    if not ordered:
+        return re.compile(r"(?!)")
+
+    if whole_word:
+        alternation = "|".join(
+            re.escape(keyword[:-1]) + r"\w*" if keyword.endswith("*") else re.escape(keyword)
+            for keyword in ordered
+        )
+        return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+    alternation = "|".join(re.escape(keyword) for keyword in ordered)
+    if word_start:
+        return re.compile(rf"\b(?:{alternation})", re.IGNORECASE)
+    return re.compile(alternation, re.IGNORECASE)
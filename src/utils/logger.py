@@ -2,18 +2,39 @@
 Logging configuration for AWS Lambda.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from src.config import config
 
+# Set once the root logger has been configured (warm Lambda
+# invocations and repeated imports must not rebuild handlers)
+_configured = False
+
+# Background writer used when LOG_QUEUE_ENABLED is set
+_listener = None
+
 
 def setup_logging() -> None:
     """
     Configure console logging only.
+
+    Safe to call more than once; only the first call has any effect.
+
+    With LOG_QUEUE_ENABLED, records are handed to a queue and written
+    to stdout by a background listener thread, so request handlers
+    never block on the console stream. It stays off by default because
+    a frozen Lambda container can hold queued lines until it thaws.
     """
+    global _configured, _listener
+
+    if _configured:
+        return
 
-    log_level = config.LOG_LEVEL or "INFO"
+    log_level = (config.LOG_LEVEL or "INFO").upper()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -27,13 +48,22 @@ def setup_logging() -> None:
     root_logger.handlers = []
 
     root_logger.setLevel(
-        getattr(logging, log_level.upper(), logging.INFO)
+        getattr(logging, log_level, logging.INFO)
     )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(console_handler)
+    if config.LOG_QUEUE_ENABLED:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+
+        _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+    else:
+        root_logger.addHandler(console_handler)
 
-    logging.info("Logging configured successfully")
\ No newline at end of file
+    _configured = True
+    logging.info("Logging configured successfully")
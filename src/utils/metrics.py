@@ -3,11 +3,21 @@ Metrics tracking for the ticket management system.
 """
 
 import logging
-from collections import defaultdict
+import threading
+from collections import Counter
 from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Float fields rounded by get_metrics(pretty=True)
+_ROUNDED_FIELDS = (
+    "automation_rate",
+    "escalation_rate",
+    "average_response_time",
+    "min_response_time",
+    "max_response_time",
+)
+
 
 class TicketMetrics:
     """
@@ -18,17 +28,32 @@ class TicketMetrics:
     - Escalation rate
     - Automation rate
     - Category distribution
-    - Average response time
+    - Average / min / max response time
+
+    Response times are folded into running totals, so memory and
+    get_metrics() stay constant no matter how many tickets are recorded.
+
+    Safe to share between threads. The API records tickets from the
+    async record_result on the event loop; the lock covers callers off
+    the loop, such as the threaded intake_and_faq stage and the sync
+    agent nodes in the workflow's worker threads, and sync scripts.
     """
 
     def __init__(self):
         """Initialize metrics tracker."""
+        self._lock = threading.Lock()
         self.total_tickets = 0
         self.escalated_tickets = 0
-        self.category_counts = defaultdict(int)
-        self.response_times = []
+        self.category_counts = Counter()
+        self._reset_response_times()
         logger.info("Metrics tracker initialized")
 
+    def _reset_response_times(self):
+        """Clear the running response-time aggregates."""
+        self.response_time_total = 0.0
+        self.min_response_time = 0.0
+        self.max_response_time = 0.0
+
     def record_ticket(self, category: str, escalated: bool, response_time: float):
         """
         Record metrics for a processed ticket.
@@ -38,53 +63,71 @@ class TicketMetrics:
             escalated: Whether ticket was escalated to human
             response_time: Processing time in seconds
         """
-        self.total_tickets += 1
-        self.category_counts[category] += 1
-        self.response_times.append(response_time)
+        with self._lock:
+            self.total_tickets += 1
+            self.category_counts[category] += 1
+
+            if self.total_tickets == 1 or response_time < self.min_response_time:
+                self.min_response_time = response_time
+            if response_time > self.max_response_time:
+                self.max_response_time = response_time
+            self.response_time_total += response_time
 
-        if escalated:
-            self.escalated_tickets += 1
+            if escalated:
+                self.escalated_tickets += 1
 
-        logger.debug(f"Recorded metrics - Total: {self.total_tickets}, Escalated: {self.escalated_tickets}")
+            total, escalated_total = self.total_tickets, self.escalated_tickets
 
-    def get_metrics(self) -> Dict:
+        logger.debug(f"Recorded metrics - Total: {total}, Escalated: {escalated_total}")
+
+    def get_metrics(self, pretty: bool = False) -> Dict:
         """
         Get current system metrics.
 
+        Args:
+            pretty: Round rates and times to 2 decimals for display
+
         Returns:
             Dictionary containing all metrics
         """
-        automation_rate = 0.0
-        if self.total_tickets > 0:
-            automation_rate = ((self.total_tickets - self.escalated_tickets) / self.total_tickets) * 100
-
-        avg_response_time = 0.0
-        if self.response_times:
-            avg_response_time = sum(self.response_times) / len(self.response_times)
-
-        return {
-            "total_tickets": self.total_tickets,
-            "escalated_tickets": self.escalated_tickets,
-            "automated_tickets": self.total_tickets - self.escalated_tickets,
-            "automation_rate": round(automation_rate, 2),
-            "escalation_rate": round(100 - automation_rate, 2),
-            "average_response_time": round(avg_response_time, 2),
-            "category_distribution": dict(self.category_counts),
-            "min_response_time": round(min(self.response_times), 2) if self.response_times else 0,
-            "max_response_time": round(max(self.response_times), 2) if self.response_times else 0,
-        }
+        with self._lock:
+            automation_rate = 0.0
+            avg_response_time = 0.0
+            if self.total_tickets > 0:
+                automated = self.total_tickets - self.escalated_tickets
+                automation_rate = automated / self.total_tickets * 100
+                avg_response_time = self.response_time_total / self.total_tickets
+
+            data = {
+                "total_tickets": self.total_tickets,
+                "escalated_tickets": self.escalated_tickets,
+                "automated_tickets": self.total_tickets - self.escalated_tickets,
+                "automation_rate": automation_rate,
+                "escalation_rate": 100 - automation_rate,
+                "average_response_time": avg_response_time,
+                "category_distribution": dict(self.category_counts),
+                "min_response_time": self.min_response_time,
+                "max_response_time": self.max_response_time,
+            }
+
+        if pretty:
+            for key in _ROUNDED_FIELDS:
+                data[key] = round(data[key], 2)
+
+        return data
 
     def reset(self):
         """Reset all metrics."""
-        self.total_tickets = 0
-        self.escalated_tickets = 0
-        self.category_counts = defaultdict(int)
-        self.response_times = []
+        with self._lock:
+            self.total_tickets = 0
+            self.escalated_tickets = 0
+            self.category_counts = Counter()
+            self._reset_response_times()
         logger.info("Metrics reset")
 
     def __str__(self) -> str:
         """String representation of metrics."""
-        metrics = self.get_metrics()
+        metrics = self.get_metrics(pretty=True)
         return (
             f"Tickets: {metrics['total_tickets']} | "
             f"Automated: {metrics['automation_rate']}% | "
@@ -202,14 +202,18 @@ def seed():
  
     docs = [{"id": i + 1, **faq} for i, faq in enumerate(FAQS)]
     collection.insert_many(docs)
+
+    # Index on id so max_faq_id() / sorted listing never scan the collection.
+    # Unique, so faq_debug renumbers through temporary ids (resequence_ids)
+    collection.create_index("id", unique=True)
  
     print(f"\n✅ Seeded {len(docs)} FAQs into "
           f"{config.MONGO_DB_NAME}.{config.FAQ_COLLECTION}\n")
  
-    for doc in docs:
-        print(f"  [{doc['id']}] {doc['category']} — {doc['question']}")
- 
-    print()
+    print("\n".join(
+        f"  [{doc['id']}] {doc['category']} — {doc['question']}"
+        for doc in docs
+    ) + "\n")
  
  
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+"""
+Text helpers for trimming LLM prompt inputs.
+"""
+
+import re
+
+# End of a sentence: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+
+def clip_text(text: str, max_chars: int) -> str:
+    """
+    Shorten text to at most ``max_chars`` characters at a natural break.
+
+    Prefers the last sentence end inside the limit, then the last word
+    boundary, and only cuts mid-word at the limit when neither keeps at
+    least half of the budget.
+
+    Args:
+        text: Text to shorten
+        max_chars: Maximum length of the result
+
+    Returns:
+        ``text`` unchanged if it already fits, otherwise a clipped prefix
+    """
+    if len(text) <= max_chars:
+        return text
+
+    # Search within the limit in place; only the returned prefix is copied
+    last_sentence = None
+    for last_sentence in _SENTENCE_END.finditer(text, 0, max_chars):
+        pass
+    min_keep = max_chars // 2
+    if last_sentence and last_sentence.end() >= min_keep:
+        return text[:last_sentence.end()].rstrip()
+
+    space = text.rfind(" ", 0, max_chars)
+    if space > 0 and space >= min_keep:
+        return text[:space].rstrip()
+
+    return text[:max_chars]
@@ -4,13 +4,15 @@ ticket management system.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from langgraph.graph import (
     StateGraph,
     END
 )
 
-from src.models.state import TicketState
+from src.models.state import TicketState, TicketCategory
 
 from src.agents import (
     intake_agent,
@@ -27,6 +29,52 @@ from src.agents import (
 logger = logging.getLogger(__name__)
 
 
+# =====================================================
+# INTAKE + FAQ LOOKUP (CONCURRENT)
+# =====================================================
+
+# Shared pool for the FAQ lookup that runs alongside intake
+_stage_pool = ThreadPoolExecutor(
+    thread_name_prefix="faq-lookup"
+)
+
+
+def intake_and_faq(
+    state: TicketState
+) -> TicketState:
+    """
+    Run intake and FAQ lookup concurrently.
+
+    Neither agent needs the other's output, so the
+    FAQ query to MongoDB overlaps the intake LLM call.
+    The FAQ agent works on its own copy of the state;
+    its match is copied back afterwards, with an
+    FAQ category taking precedence (as when it ran
+    after intake).
+    """
+
+    faq_state = dict(state)
+
+    faq_future = _stage_pool.submit(
+        faq_lookup_agent,
+        faq_state
+    )
+
+    state = intake_agent(state)
+    faq_state = faq_future.result()
+
+    state["faq_match"] = faq_state.get(
+        "faq_match",
+        ""
+    )
+
+    if state["faq_match"]:
+
+        state["category"] = faq_state["category"]
+
+    return state
+
+
 # =====================================================
 # FAQ ROUTER
 # =====================================================
@@ -49,8 +97,8 @@ def faq_router(
     if faq_match:
 
         logger.info(
-            f"FAQ resolved ticket "
-            f"{state['ticket_id']}"
+            "FAQ resolved ticket %s",
+            state["ticket_id"]
         )
 
         return "response_gen"
@@ -62,6 +110,14 @@ def faq_router(
 # CATEGORY ROUTER
 # =====================================================
 
+# Specialist node per category; anything else goes to general support.
+# Keyed by plain strings, the same values the state holds.
+_CATEGORY_ROUTES = {
+    TicketCategory.TECHNICAL.value: "technical_support",
+    TicketCategory.BILLING.value: "billing_support",
+}
+
+
 def route_by_category(
     state: TicketState
 ) -> str:
@@ -77,20 +133,15 @@ def route_by_category(
     )
 
     logger.info(
-        f"Routing ticket "
-        f"{state['ticket_id']} "
-        f"- Category: {category}"
+        "Routing ticket %s - Category: %s",
+        state["ticket_id"],
+        category
     )
 
-    if "TECHNICAL" in category:
-
-        return "technical_support"
-
-    elif "BILLING" in category:
-
-        return "billing_support"
-
-    return "general_support"
+    return _CATEGORY_ROUTES.get(
+        category,
+        "general_support"
+    )
 
 
 # =====================================================
@@ -110,15 +161,15 @@ def handle_escalation(
     ):
 
         logger.info(
-            f"Ticket {state['ticket_id']} "
-            f"escalated to human agent"
+            "Ticket %s escalated to human agent",
+            state["ticket_id"]
         )
 
         return "escalation_response"
 
     logger.info(
-        f"Ticket {state['ticket_id']} "
-        f"proceeding to automated response"
+        "Ticket %s proceeding to automated response",
+        state["ticket_id"]
     )
 
     return "response_gen"
@@ -150,13 +201,8 @@ def create_workflow():
     # ==============================================
 
     workflow.add_node(
-        "intake",
-        intake_agent
-    )
-
-    workflow.add_node(
-        "faq_lookup",
-        faq_lookup_agent
+        "intake_faq",
+        intake_and_faq
     )
 
     workflow.add_node(
@@ -199,16 +245,7 @@ def create_workflow():
     # ==============================================
 
     workflow.set_entry_point(
-        "intake"
-    )
-
-    # ==============================================
-    # Intake → FAQ Lookup
-    # ==============================================
-
-    workflow.add_edge(
-        "intake",
-        "faq_lookup"
+        "intake_faq"
     )
 
     # ==============================================
@@ -217,7 +254,7 @@ def create_workflow():
 
     workflow.add_conditional_edges(
 
-        "faq_lookup",
+        "intake_faq",
 
         faq_router,
 
@@ -320,4 +357,28 @@ def create_workflow():
 # COMPILED APP
 # =====================================================
 
-app = create_workflow()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_app():
+    """
+    Return the compiled workflow, building it
+    on first use only.
+    """
+
+    return create_workflow()
+
+
+def __getattr__(
+    name: str
+):
+    """
+    Keep `from src.workflow import app` working
+    without compiling the graph at import time.
+    """
+
+    if name == "app":
+
+        return get_app()
+
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
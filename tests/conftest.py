@@ -4,169 +4,146 @@ Pytest fixtures and configuration for agent tests.
 
 import pytest
 import os
-from datetime import datetime
+from contextlib import ExitStack
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 from typing import Dict, Any
 
-# Set fake API key for tests to avoid authentication errors
-os.environ['GROQ_API_KEY'] = 'gsk-test-fake-key-for-testing-only'
+# Fixed creation time for every fixture ticket, so states are deterministic
+FIXED_TIMESTAMP = "2024-01-01T00:00:00"
 
+# A real key in the environment enables the integration tests
+_ENV_GROQ_KEY = os.getenv('GROQ_API_KEY', '')
+HAS_REAL_GROQ_KEY = bool(_ENV_GROQ_KEY) and not _ENV_GROQ_KEY.startswith('gsk-test')
 
-@pytest.fixture
-def base_ticket_state() -> Dict[str, Any]:
-    """Basic ticket state fixture for testing."""
+# Otherwise set fake API key for tests to avoid authentication errors
+if not HAS_REAL_GROQ_KEY:
+    os.environ['GROQ_API_KEY'] = 'gsk-test-fake-key-for-testing-only'
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Without a real key, skip importing the integration tests at all."""
+    if not HAS_REAL_GROQ_KEY and collection_path.name == 'integration':
+        return True
+    return None
+
+
+# Fields every ticket fixture starts from; read-only so tests cannot
+# leak changes between fixtures. Mutable fields are created per call.
+_BASE_TICKET_STATE = MappingProxyType({
+    "category": "",
+    "faq_match": "",
+    "resolution": "",
+    "needs_escalation": False,
+    "final_response": "",
+    "priority": "medium",
+    "timestamp": FIXED_TIMESTAMP,
+})
+
+
+def _ticket_state(**fields: Any) -> Dict[str, Any]:
+    """Build a fresh ticket state from the shared defaults."""
     return {
-        "customer_query": "I need help with my account",
-        "ticket_id": "TKT-TEST001",
-        "category": "",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
+        **_BASE_TICKET_STATE,
         "conversation_history": [],
-        "customer_email": "test@example.com",
-        "priority": "medium",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
+        "metadata": {},
+        **fields,
     }
 
 
+@pytest.fixture
+def base_ticket_state() -> Dict[str, Any]:
+    """Basic ticket state fixture for testing."""
+    return _ticket_state(
+        customer_query="I need help with my account",
+        ticket_id="TKT-TEST001",
+        customer_email="test@example.com",
+    )
+
+
 @pytest.fixture
 def technical_ticket_state() -> Dict[str, Any]:
     """Ticket state for technical issues."""
-    return {
-        "customer_query": "My application crashes when I upload large files over 100MB",
-        "ticket_id": "TKT-TECH001",
-        "category": "",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [],
-        "customer_email": "tech@example.com",
-        "priority": "medium",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="My application crashes when I upload large files over 100MB",
+        ticket_id="TKT-TECH001",
+        customer_email="tech@example.com",
+    )
 
 
 @pytest.fixture
 def billing_ticket_state() -> Dict[str, Any]:
     """Ticket state for billing issues."""
-    return {
-        "customer_query": "I was charged twice for my subscription this month",
-        "ticket_id": "TKT-BILL001",
-        "category": "",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [],
-        "customer_email": "billing@example.com",
-        "priority": "medium",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="I was charged twice for my subscription this month",
+        ticket_id="TKT-BILL001",
+        customer_email="billing@example.com",
+    )
 
 
 @pytest.fixture
 def general_ticket_state() -> Dict[str, Any]:
     """Ticket state for general inquiries."""
-    return {
-        "customer_query": "How do I reset my password?",
-        "ticket_id": "TKT-GEN001",
-        "category": "",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [],
-        "customer_email": "general@example.com",
-        "priority": "medium",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="How do I reset my password?",
+        ticket_id="TKT-GEN001",
+        customer_email="general@example.com",
+    )
 
 
 @pytest.fixture
 def urgent_ticket_state() -> Dict[str, Any]:
     """Ticket state with urgent keywords."""
-    return {
-        "customer_query": "URGENT: Critical system failure affecting all users!",
-        "ticket_id": "TKT-URG001",
-        "category": "",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [],
-        "customer_email": "urgent@example.com",
-        "priority": "medium",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="URGENT: Critical system failure affecting all users!",
+        ticket_id="TKT-URG001",
+        customer_email="urgent@example.com",
+    )
 
 
 @pytest.fixture
 def escalation_ticket_state() -> Dict[str, Any]:
     """Ticket state that should trigger escalation."""
-    return {
-        "customer_query": "I want to speak to a lawyer about this unacceptable service!",
-        "ticket_id": "TKT-ESC001",
-        "category": "GENERAL",
-        "faq_match": "",
-        "resolution": "We apologize for the inconvenience...",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [],
-        "customer_email": "escalate@example.com",
-        "priority": "high",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="I want to speak to a lawyer about this unacceptable service!",
+        ticket_id="TKT-ESC001",
+        category="GENERAL",
+        resolution="We apologize for the inconvenience...",
+        customer_email="escalate@example.com",
+        priority="high",
+    )
 
 
 @pytest.fixture
 def classified_ticket_state() -> Dict[str, Any]:
     """Ticket state that has been classified."""
-    return {
-        "customer_query": "My app is crashing",
-        "ticket_id": "TKT-CLASS001",
-        "category": "TECHNICAL",
-        "faq_match": "",
-        "resolution": "",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": ["[INTAKE] Customer reports app crash"],
-        "customer_email": "classified@example.com",
-        "priority": "high",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+    return _ticket_state(
+        customer_query="My app is crashing",
+        ticket_id="TKT-CLASS001",
+        category="TECHNICAL",
+        conversation_history=["[INTAKE] Customer reports app crash"],
+        customer_email="classified@example.com",
+        priority="high",
+    )
 
 
 @pytest.fixture
 def resolved_ticket_state() -> Dict[str, Any]:
     """Ticket state with resolution."""
-    return {
-        "customer_query": "How do I reset my password?",
-        "ticket_id": "TKT-RES001",
-        "category": "GENERAL",
-        "faq_match": "Click 'Forgot Password' on the login page",
-        "resolution": "To reset your password:\n1. Go to login page\n2. Click 'Forgot Password'\n3. Enter your email\n4. Check your email for reset link",
-        "needs_escalation": False,
-        "final_response": "",
-        "conversation_history": [
+    return _ticket_state(
+        customer_query="How do I reset my password?",
+        ticket_id="TKT-RES001",
+        category="GENERAL",
+        faq_match="Click 'Forgot Password' on the login page",
+        resolution="To reset your password:\n1. Go to login page\n2. Click 'Forgot Password'\n3. Enter your email\n4. Check your email for reset link",
+        conversation_history=[
             "[INTAKE] Customer asking about password reset",
-            "[FAQ] Match found",
             "[CLASSIFIER] Category: GENERAL",
             "[GENERAL] Resolution provided"
         ],
-        "customer_email": "resolved@example.com",
-        "priority": "low",
-        "timestamp": datetime.now().isoformat(),
-        "metadata": {}
-    }
+        customer_email="resolved@example.com",
+        priority="low",
+    )
 
 
 @pytest.fixture
@@ -208,6 +185,34 @@ def sample_faq_database() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(autouse=True)
+def _fresh_faq_cache():
+    """Make every test read FAQs through (possibly patched) load_faq_database."""
+    from src.agents import faq_agent
+
+    faq_agent.invalidate_faq_cache()
+    yield
+    faq_agent.invalidate_faq_cache()
+
+
+@pytest.fixture(scope="session")
+def agents() -> SimpleNamespace:
+    """The agent node functions, imported once per session."""
+    import src.agents as agent_nodes
+
+    return SimpleNamespace(
+        intake=agent_nodes.intake_agent,
+        faq=agent_nodes.faq_lookup_agent,
+        classifier=agent_nodes.classifier_agent,
+        technical=agent_nodes.technical_support_agent,
+        billing=agent_nodes.billing_support_agent,
+        general=agent_nodes.general_support_agent,
+        escalation=agent_nodes.escalation_evaluator_agent,
+        escalation_response=agent_nodes.escalation_response_agent,
+        response=agent_nodes.response_generator_agent,
+    )
+
+
 @pytest.fixture
 def mock_llm_response():
     """Mock LLM response."""
@@ -218,8 +223,49 @@ def mock_llm_response():
     return _create_mock
 
 
+def _clear_cached_clients():
+    """Drop the shared LLM clients so they are rebuilt from (patched) ChatGroq."""
+    from src.agents import _llm
+
+    _llm.get_llm.cache_clear()
+
+
+# Where the shared agent clients are built
+_CHATGROQ_TARGETS = (
+    'src.agents._llm.ChatGroq',
+)
+
+
+@pytest.fixture(scope="class")
+def _patched_chatgroq():
+    """
+    Patch ChatGroq once per test class; tests only swap the reply.
+
+    Yields the shared response object every mocked invoke() returns.
+    """
+    response = SimpleNamespace(content='')
+
+    # Plain stand-in for the chat model; no Mock call recording per invoke()
+    class MockLLM:
+        def invoke(self, *args, **kwargs):
+            return response
+
+    mock_chat_class = Mock(return_value=MockLLM())
+
+    # All patches are undone together when the stack closes, even if a test fails
+    with ExitStack() as stack:
+        for target in _CHATGROQ_TARGETS:
+            stack.enter_context(patch(target, mock_chat_class))
+
+        # Cached clients must be rebuilt with the patched ChatGroq
+        _clear_cached_clients()
+        stack.callback(_clear_cached_clients)
+
+        yield response
+
+
 @pytest.fixture
-def mock_chatgpt():
+def mock_chatgpt(_patched_chatgroq):
     """
     Mock ChatGroq to avoid actual API calls.
 
@@ -227,50 +273,10 @@ def mock_chatgpt():
         mock_chatgpt("Expected response content")
         result = agent(state)
     """
-    # Store patches and shared mocks
-    patches = []
-
-    # Store the current response content (mutable container to allow updates)
-    response_container = {'content': ''}
-
-    # Create response object class
-    class MockResponse:
-        @property
-        def content(self):
-            return response_container['content']
-
-    # Create a callable mock LLM that returns the response
-    # LangChain's pipe operator wraps the LLM in a RunnableLambda which calls it
-    def mock_llm_callable(*args, **kwargs):
-        return MockResponse()
-
-    mock_llm = Mock(side_effect=mock_llm_callable)
-    mock_chat_class = Mock(return_value=mock_llm)
-
-    # Patch ChatGroq in all agent modules (where it's used, not defined)
-    agent_modules = [
-        'src.agents.intake_agent',
-        'src.agents.faq_agent',
-        'src.agents.classifier_agent',
-        'src.agents.technical_agent',
-        'src.agents.billing_agent',
-        'src.agents.general_agent',
-        'src.agents.escalation_agent',
-        'src.agents.escalation_response_agent',
-        'src.agents.response_agent',
-    ]
-
-    for module in agent_modules:
-        patcher = patch(f'{module}.ChatGroq', mock_chat_class)
-        patches.append(patcher)
-        patcher.start()
-
-    def _mock_with_response(response_content: str):
-        # Update the response content
-        response_container['content'] = response_content
-
-    yield _mock_with_response
-
-    # Cleanup: stop all patches
-    for patcher in patches:
-        patcher.stop()
+    # Every test starts from an empty reply, whatever the previous test set
+    _patched_chatgroq.content = ''
+
+    def _mock_with_response(content: str):
+        _patched_chatgroq.content = content
+
+    return _mock_with_response
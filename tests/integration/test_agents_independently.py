@@ -7,46 +7,136 @@ or skipped if no API key is available.
 Run individual agent tests:
     pytest tests/integration/test_agents_independently.py::TestIntakeAgentIndependent -v
     pytest tests/integration/test_agents_independently.py::TestClassifierAgentIndependent -v
+
+Each test builds its own state, so the module can run in parallel:
+    pytest tests/integration/test_agents_independently.py -n auto
+
+Agent output is logged at DEBUG; to see it while running:
+    pytest tests/integration/test_agents_independently.py -s --log-cli-level=DEBUG
 """
 
+import asyncio
+import logging
 import pytest
 import os
-from datetime import datetime
+import re
+import socket
+
+logger = logging.getLogger(__name__)
+
+# History entry written by the classifier, e.g. "[CLASSIFIER] Category: BILLING (rules)"
+_CLASSIFIER_ENTRY = re.compile(r"\[CLASSIFIER\] Category: (TECHNICAL|BILLING|GENERAL)\b")
 
 # Check if Groq API key is available
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 HAS_API_KEY = GROQ_API_KEY and not GROQ_API_KEY.startswith("gsk-test")
 
-# Skip all tests in this file if no real API key
-pytestmark = pytest.mark.skipif(
-    not HAS_API_KEY,
-    reason="Requires real GROQ_API_KEY for integration tests"
-)
+
+def _groq_reachable(timeout: float = 2.0) -> bool:
+    """One quick TCP connect, so an offline run skips instead of timing out per test."""
+    try:
+        with socket.create_connection(("api.groq.com", 443), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+# Probed once at collection, and only when there is a key to use
+GROQ_REACHABLE = bool(HAS_API_KEY) and _groq_reachable()
+
+# One fixed creation time shared by every ticket state in this module
+TIMESTAMP = "2024-01-01T00:00:00"
+
+# Fields the standalone tests leave at their defaults
+_STATE_DEFAULTS = {
+    "category": "",
+    "faq_match": "",
+    "resolution": "",
+    "needs_escalation": False,
+    "final_response": "",
+    "customer_email": "test@example.com",
+    "priority": "medium",
+    "timestamp": TIMESTAMP,
+}
+
+
+def make_state(**overrides):
+    """Build a fresh ticket state (new history/metadata containers each call)."""
+    return {
+        **_STATE_DEFAULTS,
+        "conversation_history": [],
+        "metadata": {},
+        **overrides,
+    }
+
+
+# Default request budget for this module when LLM_REQUESTS_PER_MINUTE is unset
+INTEGRATION_RPM = 30
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _throttle_groq():
+    """
+    Space API calls below Groq's rate limit instead of relying on 429 retries.
+    The bucket is per process, so with ``-n N`` each worker gets its own.
+    """
+    from src.agents import _llm
+    from src.config import config
+
+    with pytest.MonkeyPatch.context() as mp:
+        if config.LLM_REQUESTS_PER_MINUTE <= 0:
+            mp.setattr(config, "LLM_REQUESTS_PER_MINUTE", INTEGRATION_RPM)
+        _llm._rate_limiter.cache_clear()
+        _llm.get_llm.cache_clear()
+        yield
+    _llm._rate_limiter.cache_clear()
+    _llm.get_llm.cache_clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_groq_pool():
+    """
+    Open the shared keep-alive connection to Groq before the first test,
+    so no single test absorbs the TLS handshake. Listing models is free;
+    a failure here is left for the real tests to report.
+    """
+    from src.agents._llm import _http_clients
+
+    http_client, _ = _http_clients()
+    try:
+        http_client.get(
+            "https://api.groq.com/openai/v1/models",
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            timeout=5.0
+        )
+    except Exception:
+        pass
+
+
+# Skip all tests in this file if no real API key, or Groq cannot be reached
+pytestmark = [
+    pytest.mark.skipif(
+        not HAS_API_KEY,
+        reason="Requires real GROQ_API_KEY for integration tests"
+    ),
+    pytest.mark.skipif(
+        bool(HAS_API_KEY) and not GROQ_REACHABLE,
+        reason="Groq API is unreachable from this machine"
+    ),
+]
 
 
 class TestIntakeAgentIndependent:
     """Test Intake Agent independently with real API calls."""
 
-    def test_intake_agent_standalone(self):
+    def test_intake_agent_standalone(self, agents):
         """Test intake agent can run standalone."""
-        from src.agents.intake_agent import intake_agent
-
-        state = {
-            "customer_query": "My application is crashing when I try to upload files",
-            "ticket_id": "TEST-INTAKE-001",
-            "category": "",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "medium",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = intake_agent(state)
+        state = make_state(
+            customer_query="My application is crashing when I try to upload files",
+            ticket_id="TEST-INTAKE-001",
+        )
+
+        result = agents.intake(state)
 
         # Verify agent execution
         assert result is not None
@@ -55,294 +145,232 @@ class TestIntakeAgentIndependent:
         assert len(result["conversation_history"]) > 0
         assert "[INTAKE]" in result["conversation_history"][0]
 
-        print(f"\n✅ Intake Agent Test Passed")
-        print(f"   Priority: {result['priority']}")
-        print(f"   History: {result['conversation_history'][0][:100]}...")
+        logger.debug("Intake priority: %s, history: %.100s",
+                     result["priority"], result["conversation_history"][0])
 
 
 class TestFAQAgentIndependent:
     """Test FAQ Lookup Agent independently."""
 
-    def test_faq_agent_standalone(self):
+    def test_faq_agent_standalone(self, agents):
         """Test FAQ agent can run standalone."""
-        from src.agents.faq_agent import faq_lookup_agent
-
-        state = {
-            "customer_query": "How do I reset my password?",
-            "ticket_id": "TEST-FAQ-001",
-            "category": "",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "medium",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = faq_lookup_agent(state)
+        state = make_state(
+            customer_query="How do I reset my password?",
+            ticket_id="TEST-FAQ-001",
+        )
+
+        result = agents.faq(state)
 
         # Verify agent execution
         assert result is not None
         assert "faq_match" in result
-        assert len(result["conversation_history"]) > 0
-        assert "[FAQ]" in result["conversation_history"][0]
+        # A match takes the FAQ's category; no match leaves it unclassified
+        if result["faq_match"]:
+            assert result["category"] in ("TECHNICAL", "BILLING", "GENERAL")
+        else:
+            assert result["category"] == ""
+        assert result["conversation_history"] == []
 
-        print(f"\n✅ FAQ Agent Test Passed")
-        print(f"   FAQ Match: {result['faq_match'][:100] if result['faq_match'] else 'No match'}...")
-        print(f"   History: {result['conversation_history'][0]}")
+        logger.debug("FAQ match: %.100s, category: %s",
+                     result["faq_match"] or "No match", result["category"] or "-")
 
 
 class TestClassifierAgentIndependent:
     """Test Classifier Agent independently."""
 
-    def test_classifier_technical(self):
+    def test_classifier_technical(self, agents):
         """Test classifier with technical query."""
-        from src.agents.classifier_agent import classifier_agent
-
-        state = {
-            "customer_query": "My app crashes when uploading files",
-            "ticket_id": "TEST-CLASS-001",
-            "category": "",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "medium",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = classifier_agent(state)
+        state = make_state(
+            customer_query="My app crashes when uploading files",
+            ticket_id="TEST-CLASS-001",
+        )
+
+        result = agents.classifier(state)
 
         # Verify agent execution
         assert result is not None
         assert result["category"] in ["TECHNICAL", "BILLING", "GENERAL", "UNKNOWN"]
         assert len(result["conversation_history"]) > 0
+        entry = _CLASSIFIER_ENTRY.match(result["conversation_history"][-1])
+        assert entry and entry.group(1) == result["category"]
 
-        print(f"\n✅ Classifier Agent Test Passed (Technical)")
-        print(f"   Category: {result['category']}")
-        print(f"   History: {result['conversation_history'][-1]}")
+        logger.debug("Technical query classified as %s (%s)",
+                     result["category"], result["conversation_history"][-1])
 
-    def test_classifier_billing(self):
+    def test_classifier_billing(self, agents):
         """Test classifier with billing query."""
-        from src.agents.classifier_agent import classifier_agent
-
-        state = {
-            "customer_query": "I was charged twice this month",
-            "ticket_id": "TEST-CLASS-002",
-            "category": "",
-            "faq_match": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "medium",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = classifier_agent(state)
+        state = make_state(
+            customer_query="I was charged twice this month",
+            ticket_id="TEST-CLASS-002",
+        )
+
+        result = agents.classifier(state)
 
         assert result["category"] in ["TECHNICAL", "BILLING", "GENERAL", "UNKNOWN"]
-        print(f"\n✅ Classifier Agent Test Passed (Billing)")
-        print(f"   Category: {result['category']}")
+        entry = _CLASSIFIER_ENTRY.match(result["conversation_history"][-1])
+        assert entry and entry.group(1) == result["category"]
+        logger.debug("Billing query classified as %s", result["category"])
+
+    def test_classifier_batch(self):
+        """Test the classification prompt on several queries in one batch call."""
+        from src.agents._llm import chat_messages, get_llm
+        from src.agents.classifier_agent import _SYSTEM_MESSAGE, _USER_TEMPLATE
+
+        queries = [
+            "My app crashes when uploading files",
+            "I was charged twice this month",
+            "How do I change my email?",
+        ]
+        prompts = [
+            chat_messages(_SYSTEM_MESSAGE, _USER_TEMPLATE, {"query": query, "faq_match": ""})
+            for query in queries
+        ]
+
+        responses = get_llm(0.1).batch(prompts)
+
+        # One answer per query, in query order
+        categories = [response.content.strip().upper() for response in responses]
+        assert len(categories) == len(queries)
+        for category in categories:
+            assert category in ["TECHNICAL", "BILLING", "GENERAL"]
+
+        logger.debug("Batch categories: %s", list(zip(categories, queries)))
 
 
 class TestTechnicalAgentIndependent:
     """Test Technical Support Agent independently."""
 
-    def test_technical_agent_standalone(self):
+    def test_technical_agent_standalone(self, agents):
         """Test technical agent can run standalone."""
-        from src.agents.technical_agent import technical_support_agent
-
-        state = {
-            "customer_query": "My application crashes when I upload large files",
-            "ticket_id": "TEST-TECH-001",
-            "category": "TECHNICAL",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": ["[CLASSIFIER] Category: TECHNICAL"],
-            "customer_email": "test@example.com",
-            "priority": "high",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = technical_support_agent(state)
+        state = make_state(
+            customer_query="My application crashes when I upload large files",
+            ticket_id="TEST-TECH-001",
+            category="TECHNICAL",
+            conversation_history=["[CLASSIFIER] Category: TECHNICAL"],
+            priority="high",
+        )
+
+        result = agents.technical(state)
 
         # Verify agent execution
         assert result is not None
         assert result["resolution"] != ""
         assert len(result["conversation_history"]) > 1
 
-        print(f"\n✅ Technical Agent Test Passed")
-        print(f"   Resolution length: {len(result['resolution'])} chars")
-        print(f"   Preview: {result['resolution'][:150]}...")
+        logger.debug("Technical resolution (%d chars): %.150s",
+                     len(result["resolution"]), result["resolution"])
 
 
 class TestBillingAgentIndependent:
     """Test Billing Support Agent independently."""
 
-    def test_billing_agent_standalone(self):
+    def test_billing_agent_standalone(self, agents):
         """Test billing agent can run standalone."""
-        from src.agents.billing_agent import billing_support_agent
-
-        state = {
-            "customer_query": "I was charged twice for my subscription",
-            "ticket_id": "TEST-BILL-001",
-            "category": "BILLING",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": ["[CLASSIFIER] Category: BILLING"],
-            "customer_email": "test@example.com",
-            "priority": "high",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = billing_support_agent(state)
+        state = make_state(
+            customer_query="I was charged twice for my subscription",
+            ticket_id="TEST-BILL-001",
+            category="BILLING",
+            conversation_history=["[CLASSIFIER] Category: BILLING"],
+            priority="high",
+        )
+
+        result = agents.billing(state)
 
         # Verify agent execution
         assert result is not None
         assert result["resolution"] != ""
         assert len(result["conversation_history"]) > 1
 
-        print(f"\n✅ Billing Agent Test Passed")
-        print(f"   Resolution length: {len(result['resolution'])} chars")
-        print(f"   Preview: {result['resolution'][:150]}...")
+        logger.debug("Billing resolution (%d chars): %.150s",
+                     len(result["resolution"]), result["resolution"])
 
 
 class TestGeneralAgentIndependent:
     """Test General Support Agent independently."""
 
-    def test_general_agent_standalone(self):
+    def test_general_agent_standalone(self, agents):
         """Test general agent can run standalone."""
-        from src.agents.general_agent import general_support_agent
-
-        state = {
-            "customer_query": "How do I change my email address?",
-            "ticket_id": "TEST-GEN-001",
-            "category": "GENERAL",
-            "faq_match": "",
-            "resolution": "",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": ["[CLASSIFIER] Category: GENERAL"],
-            "customer_email": "test@example.com",
-            "priority": "low",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = general_support_agent(state)
+        state = make_state(
+            customer_query="How do I change my email address?",
+            ticket_id="TEST-GEN-001",
+            category="GENERAL",
+            conversation_history=["[CLASSIFIER] Category: GENERAL"],
+            priority="low",
+        )
+
+        result = agents.general(state)
 
         # Verify agent execution
         assert result is not None
         assert result["resolution"] != ""
         assert len(result["conversation_history"]) > 1
 
-        print(f"\n✅ General Agent Test Passed")
-        print(f"   Resolution length: {len(result['resolution'])} chars")
-        print(f"   Preview: {result['resolution'][:150]}...")
+        logger.debug("General resolution (%d chars): %.150s",
+                     len(result["resolution"]), result["resolution"])
 
 
 class TestEscalationAgentIndependent:
     """Test Escalation Evaluator Agent independently."""
 
-    def test_escalation_agent_no_escalation(self):
+    def test_escalation_agent_no_escalation(self, agents):
         """Test escalation agent with simple query."""
-        from src.agents.escalation_agent import escalation_evaluator_agent
-
-        state = {
-            "customer_query": "How do I reset my password?",
-            "ticket_id": "TEST-ESC-001",
-            "category": "GENERAL",
-            "faq_match": "Click 'Forgot Password'",
-            "resolution": "Follow the forgot password link on the login page",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "low",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = escalation_evaluator_agent(state)
+        state = make_state(
+            customer_query="How do I reset my password?",
+            ticket_id="TEST-ESC-001",
+            category="GENERAL",
+            faq_match="Click 'Forgot Password'",
+            resolution="Follow the forgot password link on the login page",
+            priority="low",
+        )
+
+        result = agents.escalation(state)
 
         # Verify agent execution
         assert result is not None
         assert "needs_escalation" in result
         assert len(result["conversation_history"]) > 0
 
-        print(f"\n✅ Escalation Agent Test Passed (No Escalation)")
-        print(f"   Needs Escalation: {result['needs_escalation']}")
+        logger.debug("Needs escalation: %s", result["needs_escalation"])
 
-    def test_escalation_agent_with_keyword(self):
+    def test_escalation_agent_with_keyword(self, agents):
         """Test escalation agent with escalation keyword."""
-        from src.agents.escalation_agent import escalation_evaluator_agent
-
-        state = {
-            "customer_query": "This is urgent! I need help immediately!",
-            "ticket_id": "TEST-ESC-002",
-            "category": "TECHNICAL",
-            "faq_match": "",
-            "resolution": "We're looking into this",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [],
-            "customer_email": "test@example.com",
-            "priority": "high",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
-
-        result = escalation_evaluator_agent(state)
+        state = make_state(
+            customer_query="This is urgent! I need help immediately!",
+            ticket_id="TEST-ESC-002",
+            category="TECHNICAL",
+            resolution="We're looking into this",
+            priority="high",
+        )
+
+        result = agents.escalation(state)
 
         # Should auto-escalate due to "urgent" keyword
         assert result["needs_escalation"] is True
 
-        print(f"\n✅ Escalation Agent Test Passed (Auto-Escalate)")
-        print(f"   Needs Escalation: {result['needs_escalation']}")
-        print(f"   Reason: Keyword detected")
+        logger.debug("Needs escalation: %s (keyword)", result["needs_escalation"])
 
 
 class TestEscalationResponseAgentIndependent:
     """Test Escalation Response Agent independently."""
 
-    def test_escalation_response_agent_standalone(self):
+    def test_escalation_response_agent_standalone(self, agents):
         """Test escalation response agent can run standalone."""
-        from src.agents.escalation_response_agent import escalation_response_agent
-
-        state = {
-            "customer_query": "I need a full refund of $2000 for this broken service!",
-            "ticket_id": "TEST-ESCRESP-001",
-            "category": "BILLING",
-            "faq_match": "",
-            "resolution": "High-value refund requires account verification and approval",
-            "needs_escalation": True,
-            "final_response": "",
-            "conversation_history": [
+        state = make_state(
+            customer_query="I need a full refund of $2000 for this broken service!",
+            ticket_id="TEST-ESCRESP-001",
+            category="BILLING",
+            resolution="High-value refund requires account verification and approval",
+            needs_escalation=True,
+            conversation_history=[
                 "[INTAKE] Customer requesting refund",
-                "[FAQ] No match found",
                 "[CLASSIFIER] Category: BILLING",
                 "[BILLING] Resolution provided",
                 "[ESCALATION] Marked for human review"
             ],
-            "customer_email": "test@example.com",
-            "priority": "high",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
+            priority="high",
+        )
 
-        result = escalation_response_agent(state)
+        result = agents.escalation_response(state)
 
         # Verify agent execution
         assert result is not None
@@ -350,82 +378,101 @@ class TestEscalationResponseAgentIndependent:
         assert len(result["conversation_history"]) > 5
         assert "[ESCALATION RESPONSE]" in result["conversation_history"][-1]
 
-        print(f"\n✅ Escalation Response Agent Test Passed")
-        print(f"   Response length: {len(result['final_response'])} chars")
-        print(f"   Preview: {result['final_response'][:150]}...")
+        logger.debug("Escalation response (%d chars): %.150s",
+                     len(result["final_response"]), result["final_response"])
 
-    def test_escalation_response_technical_issue(self):
+    def test_escalation_response_technical_issue(self, agents):
         """Test escalation response for technical category."""
-        from src.agents.escalation_response_agent import escalation_response_agent
-
-        state = {
-            "customer_query": "Critical bug in production causing data loss!",
-            "ticket_id": "TEST-ESCRESP-002",
-            "category": "TECHNICAL",
-            "faq_match": "",
-            "resolution": "Critical system issue requiring engineering investigation",
-            "needs_escalation": True,
-            "final_response": "",
-            "conversation_history": [
+        state = make_state(
+            customer_query="Critical bug in production causing data loss!",
+            ticket_id="TEST-ESCRESP-002",
+            category="TECHNICAL",
+            resolution="Critical system issue requiring engineering investigation",
+            needs_escalation=True,
+            conversation_history=[
                 "[INTAKE] Customer reports critical bug",
                 "[CLASSIFIER] Category: TECHNICAL",
                 "[TECHNICAL] Resolution provided",
                 "[ESCALATION] Marked for human review"
             ],
-            "customer_email": "test@example.com",
-            "priority": "high",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
+            priority="high",
+        )
 
-        result = escalation_response_agent(state)
+        result = agents.escalation_response(state)
 
         # Verify escalation response generated
         assert result is not None
         assert result["final_response"] != ""
 
-        print(f"\n✅ Escalation Response Agent Test Passed (Technical)")
-        print(f"   Category: {result['category']}")
-        print(f"   Response: {result['final_response'][:100]}...")
+        logger.debug("%s escalation response: %.100s",
+                     result["category"], result["final_response"])
+
+    def test_all_escalation_paths_concurrently(self, agents):
+        """Test both escalation categories with their calls in flight together."""
+        states = [
+            make_state(
+                customer_query="I need a full refund of $2000 for this broken service!",
+                ticket_id="TEST-ESCRESP-003",
+                category="BILLING",
+                resolution="High-value refund requires account verification and approval",
+                needs_escalation=True,
+                priority="high",
+            ),
+            make_state(
+                customer_query="Critical bug in production causing data loss!",
+                ticket_id="TEST-ESCRESP-004",
+                category="TECHNICAL",
+                resolution="Critical system issue requiring engineering investigation",
+                needs_escalation=True,
+                priority="high",
+            ),
+        ]
+
+        # Agents are sync; run each on a worker thread so the API calls overlap
+        async def run():
+            return await asyncio.gather(*(
+                asyncio.to_thread(agents.escalation_response, state) for state in states
+            ))
+
+        results = asyncio.run(run())
+
+        assert [result["ticket_id"] for result in results] == ["TEST-ESCRESP-003", "TEST-ESCRESP-004"]
+        for result in results:
+            assert result["final_response"] != ""
+
+        for result in results:
+            logger.debug("%s escalation response: %.80s",
+                         result["category"], result["final_response"])
 
 
 class TestResponseAgentIndependent:
     """Test Response Generator Agent independently."""
 
-    def test_response_agent_standalone(self):
+    def test_response_agent_standalone(self, agents):
         """Test response agent can run standalone."""
-        from src.agents.response_agent import response_generator_agent
-
-        state = {
-            "customer_query": "How do I reset my password?",
-            "ticket_id": "TEST-RESP-001",
-            "category": "GENERAL",
-            "faq_match": "Click 'Forgot Password'",
-            "resolution": "To reset your password:\n1. Go to login page\n2. Click 'Forgot Password'\n3. Follow email instructions",
-            "needs_escalation": False,
-            "final_response": "",
-            "conversation_history": [
+        state = make_state(
+            customer_query="How do I reset my password?",
+            ticket_id="TEST-RESP-001",
+            category="GENERAL",
+            faq_match="Click 'Forgot Password'",
+            resolution="To reset your password:\n1. Go to login page\n2. Click 'Forgot Password'\n3. Follow email instructions",
+            conversation_history=[
                 "[INTAKE] Customer asking about password",
-                "[FAQ] Match found",
                 "[CLASSIFIER] Category: GENERAL",
                 "[GENERAL] Resolution provided"
             ],
-            "customer_email": "test@example.com",
-            "priority": "low",
-            "timestamp": datetime.now().isoformat(),
-            "metadata": {}
-        }
+            priority="low",
+        )
 
-        result = response_generator_agent(state)
+        result = agents.response(state)
 
         # Verify agent execution
         assert result is not None
         assert result["final_response"] != ""
         assert len(result["conversation_history"]) > 4
 
-        print(f"\n✅ Response Agent Test Passed")
-        print(f"   Response length: {len(result['final_response'])} chars")
-        print(f"   Preview: {result['final_response'][:150]}...")
+        logger.debug("Final response (%d chars): %.150s",
+                     len(result["final_response"]), result["final_response"])
 
 
 if __name__ == "__main__":
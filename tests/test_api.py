@@ -0,0 +1,102 @@
+"""
+Tests for the FastAPI endpoints.
+
+Tests that processed tickets are written through the async Motor
+collection, i.e. that insert_one is awaited on the event loop.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import main
+
+
+PROCESSED = {
+    "ticket_id": "TKT-API1",
+    "customer_query": "My app crashes on upload",
+    "customer_email": None,
+    "category": "TECHNICAL",
+    "faq_match": "",
+    "resolution": "Clear the cache.",
+    "needs_escalation": False,
+    "final_response": "Please clear the cache and retry.",
+    "conversation_history": ["Intake: received"],
+    "priority": "medium",
+    "timestamp": "2024-01-15T10:30:00",
+    "metadata": {}
+}
+
+
+class FakeWorkflow:
+    """Stand-in for the compiled graph that returns a finished ticket."""
+
+    async def ainvoke(self, state):
+        return {**PROCESSED, "ticket_id": state["ticket_id"]}
+
+    async def astream(self, state, stream_mode=None):
+        yield "values", {**PROCESSED, "ticket_id": state["ticket_id"]}
+
+
+@pytest.fixture
+def tickets(monkeypatch):
+    """Patch the tickets collection with an async insert_one."""
+    collection = MagicMock()
+    collection.insert_one = AsyncMock()
+    monkeypatch.setattr(main, "get_tickets_collection", lambda: collection)
+    monkeypatch.setattr(main, "workflow_app", FakeWorkflow())
+    main.metrics.reset()
+    yield collection
+    main.metrics.reset()
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.api_app)
+
+
+class TestTicketPersistence:
+    """Test suite for saving processed tickets."""
+
+    def test_process_awaits_insert(self, tickets, client):
+        """Test that /process saves the ticket with an awaited insert_one."""
+        response = client.post(
+            "/api/v1/tickets/process",
+            json={"customer_query": "My app crashes on upload", "ticket_id": "TKT-API1"}
+        )
+
+        assert response.status_code == 200
+        tickets.insert_one.assert_awaited_once()
+        doc = tickets.insert_one.await_args.args[0]
+        assert doc["ticket_id"] == "TKT-API1"
+        assert doc["category"] == "TECHNICAL"
+        assert main.metrics.get_metrics()["total_tickets"] == 1
+
+    def test_stream_awaits_insert(self, tickets, client):
+        """Test that the streaming endpoint saves the ticket with an awaited insert_one."""
+        response = client.post(
+            "/api/v1/tickets/process/stream",
+            json={"customer_query": "My app crashes on upload", "ticket_id": "TKT-API2"}
+        )
+
+        assert response.status_code == 200
+        assert "event: done" in response.text
+        tickets.insert_one.assert_awaited_once()
+        assert tickets.insert_one.await_args.args[0]["ticket_id"] == "TKT-API2"
+
+    def test_save_failure_is_logged_not_raised(self, tickets, client):
+        """Test that a failed insert does not fail the request."""
+        tickets.insert_one.side_effect = RuntimeError("connection refused")
+
+        response = client.post(
+            "/api/v1/tickets/process",
+            json={"customer_query": "My app crashes on upload"}
+        )
+
+        assert response.status_code == 200
+        tickets.insert_one.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
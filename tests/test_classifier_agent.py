@@ -11,65 +11,26 @@ from src.agents.classifier_agent import classifier_agent
 class TestClassifierAgent:
     """Test suite for Classifier Agent."""
 
-    def test_classifier_technical_category(self, technical_ticket_state, mock_chatgpt):
-        """Test classification of technical issues."""
-        # Mock LLM to return TECHNICAL
-        mock_chatgpt("TECHNICAL")
-
-        # Run the agent
-        result = classifier_agent(technical_ticket_state)
-
-        # Assertions
-        assert result["category"] == "TECHNICAL"
-        assert len(result["conversation_history"]) == 1
-        assert "[CLASSIFIER] Category: TECHNICAL" in result["conversation_history"][0]
+    # Queries miss every category keyword, so the LLM reply is what gets parsed
+    @pytest.mark.parametrize("llm_output, expected, query", [
+        ("TECHNICAL", "TECHNICAL", "The app shuts down when I open the settings page"),
+        ("BILLING", "BILLING", "Why did my monthly price go up?"),
+        ("GENERAL", "GENERAL", "How do I reset my password?"),
+        ("INVALID_CATEGORY", "GENERAL", "I need help with my account"),
+        ("technical", "TECHNICAL", "The page stays blank after login"),
+        ("General", "GENERAL", "Where can I find the user guide?"),
+        ("  BILLING  \n", "BILLING", "Can I pay in installments?"),
+    ])
+    def test_classifier_category(self, base_ticket_state, llm_output, expected, query, mock_chatgpt):
+        """Test LLM reply parsing, normalization and the invalid-category fallback."""
+        base_ticket_state["customer_query"] = query
+        mock_chatgpt(llm_output)
 
-    def test_classifier_billing_category(self, billing_ticket_state, mock_chatgpt):
-        """Test classification of billing issues."""
-        # Mock LLM to return BILLING
-        mock_chatgpt("BILLING")
-
-        # Run the agent
-        result = classifier_agent(billing_ticket_state)
-
-        # Assertions
-        assert result["category"] == "BILLING"
-        assert "[CLASSIFIER] Category: BILLING" in result["conversation_history"][0]
-
-    def test_classifier_general_category(self, general_ticket_state, mock_chatgpt):
-        """Test classification of general inquiries."""
-        # Mock LLM to return GENERAL
-        mock_chatgpt("GENERAL")
-
-        # Run the agent
-        result = classifier_agent(general_ticket_state)
-
-        # Assertions
-        assert result["category"] == "GENERAL"
-        assert "[CLASSIFIER] Category: GENERAL" in result["conversation_history"][0]
-
-    def test_classifier_invalid_category_defaults_to_general(self, base_ticket_state, mock_chatgpt):
-        """Test that invalid categories default to GENERAL."""
-        # Mock LLM to return invalid category
-        mock_chatgpt("INVALID_CATEGORY")
-
-        # Run the agent
         result = classifier_agent(base_ticket_state)
 
-        # Should default to GENERAL
-        assert result["category"] == "GENERAL"
-        assert "[CLASSIFIER]" in result["conversation_history"][0]
-
-    def test_classifier_lowercase_category(self, technical_ticket_state, mock_chatgpt):
-        """Test that lowercase categories are normalized to uppercase."""
-        # Mock LLM to return lowercase
-        mock_chatgpt("technical")
-
-        # Run the agent
-        result = classifier_agent(technical_ticket_state)
-
-        # Should be normalized to uppercase
-        assert result["category"] == "TECHNICAL"
+        assert result["category"] == expected
+        assert len(result["conversation_history"]) == 1
+        assert f"[CLASSIFIER] Category: {expected}" in result["conversation_history"][0]
 
     def test_classifier_with_faq_match_context(self, general_ticket_state, mock_chatgpt):
         """Test that classifier uses FAQ match as context."""
@@ -107,8 +68,7 @@ class TestClassifierAgent:
         """Test that classifier appends to conversation history."""
         # Add existing history
         technical_ticket_state["conversation_history"] = [
-            "[INTAKE] Technical issue detected",
-            "[FAQ] No match found"
+            "[INTAKE] Technical issue detected"
         ]
 
         # Mock LLM response
@@ -117,44 +77,56 @@ class TestClassifierAgent:
         # Run the agent
         result = classifier_agent(technical_ticket_state)
 
-        # Should have all three entries
-        assert len(result["conversation_history"]) == 3
+        # Should have both entries
+        assert len(result["conversation_history"]) == 2
         assert result["conversation_history"][0] == "[INTAKE] Technical issue detected"
-        assert result["conversation_history"][1] == "[FAQ] No match found"
-        assert "[CLASSIFIER] Category: TECHNICAL" in result["conversation_history"][2]
+        assert "[CLASSIFIER] Category: TECHNICAL" in result["conversation_history"][1]
 
-    def test_classifier_with_whitespace_in_response(self, billing_ticket_state, mock_chatgpt):
-        """Test that classifier handles whitespace in LLM response."""
-        # Mock LLM response with whitespace
-        mock_chatgpt("  BILLING  \n")
+    def test_classifier_skips_llm_when_intake_classified(self, classified_ticket_state, mock_chatgpt):
+        """Test that a category proposed by intake is kept without another LLM call."""
+        # Would flip the category if the LLM were consulted
+        mock_chatgpt("BILLING")
+
+        result = classifier_agent(classified_ticket_state)
+
+        assert result["category"] == "TECHNICAL"
+        assert "[CLASSIFIER] Category: TECHNICAL (from intake)" in result["conversation_history"][-1]
+
+    def test_classifier_keyword_fast_path_skips_llm(self, billing_ticket_state, mock_chatgpt):
+        """Test that an unambiguous keyword hit classifies without consulting the LLM."""
+        # Would give a different answer if the LLM were consulted
+        mock_chatgpt("GENERAL")
 
-        # Run the agent
         result = classifier_agent(billing_ticket_state)
 
-        # Should strip whitespace
         assert result["category"] == "BILLING"
+        assert "[CLASSIFIER] Category: BILLING (rules)" in result["conversation_history"][-1]
+
+    @pytest.mark.parametrize("query", [
+        "Can I pay in installments?",
+        "I spent hours debugging the export",
+        "The card was recharged yesterday",
+        "Is discharge covered by the plan?",
+    ])
+    def test_classifier_keywords_match_whole_words_only(self, base_ticket_state, query, mock_chatgpt):
+        """Test that keywords embedded in longer words leave the query to the LLM."""
+        base_ticket_state["customer_query"] = query
+        mock_chatgpt("GENERAL")
 
-    def test_classifier_mixed_case_normalization(self, general_ticket_state, mock_chatgpt):
-        """Test various case formats are normalized."""
-        # Mock LLM response with mixed case
-        mock_chatgpt("General")
-
-        # Run the agent
-        result = classifier_agent(general_ticket_state)
+        result = classifier_agent(base_ticket_state)
 
-        # Should normalize to uppercase
         assert result["category"] == "GENERAL"
+        assert result["conversation_history"][-1] == "[CLASSIFIER] Category: GENERAL"
 
-    def test_classifier_with_extra_text(self, technical_ticket_state, mock_chatgpt):
-        """Test classifier when LLM includes extra explanation (should still work if category is there)."""
-        # Mock LLM with just the category word
-        mock_chatgpt("TECHNICAL")
+    def test_classifier_ambiguous_keywords_fall_back_to_llm(self, base_ticket_state, mock_chatgpt):
+        """Test that hits in more than one keyword bucket are left to the LLM."""
+        base_ticket_state["customer_query"] = "I get an error every time I open my invoice"
+        mock_chatgpt("BILLING")
 
-        # Run the agent
-        result = classifier_agent(technical_ticket_state)
+        result = classifier_agent(base_ticket_state)
 
-        # Should extract category correctly
-        assert result["category"] == "TECHNICAL"
+        assert result["category"] == "BILLING"
+        assert result["conversation_history"][-1] == "[CLASSIFIER] Category: BILLING"
 
 
 if __name__ == "__main__":
@@ -4,45 +4,49 @@ Tests for the FAQ Lookup Agent.
 Tests the agent that searches MongoDB for matching FAQs.
 """
 
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock
-from src.agents.faq_agent import faq_lookup_agent, load_faq_database
+from src.agents.faq_agent import (
+    faq_lookup_agent,
+    invalidate_faq_cache,
+    load_faq_database,
+    max_faq_id,
+    stream_faqs,
+)
+
+faq_agent = sys.modules["src.agents.faq_agent"]
 
 
 class TestFAQAgent:
     """Test suite for FAQ Lookup Agent."""
 
-    def test_faq_agent_finds_match(self, general_ticket_state, mock_chatgpt, sample_faq_database, monkeypatch):
-        """Test that FAQ agent finds a matching answer."""
+    def test_faq_agent_finds_match(self, general_ticket_state, sample_faq_database, monkeypatch):
+        """Test that a query close to an FAQ question takes its answer and category."""
         monkeypatch.setattr(
             "src.agents.faq_agent.load_faq_database",
             lambda: sample_faq_database
         )
 
-        mock_chatgpt("Click 'Forgot Password' on the login page and follow the instructions.")
-
         result = faq_lookup_agent(general_ticket_state)
 
-        assert result["faq_match"] != ""
-        assert "Click 'Forgot Password'" in result["faq_match"]
-        assert len(result["conversation_history"]) == 1
-        assert "[FAQ] Match found" in result["conversation_history"][0]
+        assert result["faq_match"] == "Click 'Forgot Password' on the login page and follow the instructions."
+        assert result["category"] == "GENERAL"
 
-    def test_faq_agent_no_match(self, technical_ticket_state, mock_chatgpt, sample_faq_database, monkeypatch):
-        """Test that FAQ agent handles no match scenario."""
+    def test_faq_agent_no_match(self, technical_ticket_state, sample_faq_database, monkeypatch):
+        """Test that a query unlike every FAQ question leaves faq_match empty."""
         monkeypatch.setattr(
             "src.agents.faq_agent.load_faq_database",
             lambda: sample_faq_database
         )
 
-        mock_chatgpt("NO_MATCH")
-
         result = faq_lookup_agent(technical_ticket_state)
 
         assert result["faq_match"] == ""
-        assert "[FAQ] No direct match found" in result["conversation_history"][0]
+        assert result["category"] == ""
 
-    def test_faq_agent_empty_database(self, base_ticket_state, mock_chatgpt, monkeypatch):
+    def test_faq_agent_empty_database(self, base_ticket_state, monkeypatch):
         """Test FAQ agent behavior with empty database."""
         monkeypatch.setattr(
             "src.agents.faq_agent.load_faq_database",
@@ -51,8 +55,8 @@ class TestFAQAgent:
 
         result = faq_lookup_agent(base_ticket_state)
 
-        assert result["faq_match"] == "No FAQ entries available"
-        assert "[FAQ] No FAQ database found" in result["conversation_history"][0]
+        assert result["faq_match"] == ""
+        assert result["category"] == ""
 
     def test_faq_agent_preserves_other_state(self, general_ticket_state, mock_chatgpt, sample_faq_database, monkeypatch):
         """Test that FAQ agent doesn't modify unrelated state fields."""
@@ -101,8 +105,61 @@ class TestFAQAgent:
 
         assert result == {"faqs": []}
 
-    def test_faq_agent_conversation_history_append(self, general_ticket_state, mock_chatgpt, sample_faq_database, monkeypatch):
-        """Test that FAQ agent appends to existing conversation history."""
+    def test_faq_agent_picks_most_similar_question(self, base_ticket_state, sample_faq_database, monkeypatch):
+        """Test that the closest FAQ question wins even after cheaper candidates are pruned."""
+        monkeypatch.setattr(
+            "src.agents.faq_agent.load_faq_database",
+            lambda: sample_faq_database
+        )
+        base_ticket_state["customer_query"] = "How do I cancel my subscription?"
+
+        result = faq_lookup_agent(base_ticket_state)
+
+        assert result["faq_match"] == "Go to Account Settings > Billing > Cancel Subscription."
+        assert result["category"] == "BILLING"
+
+    def test_max_faq_id_reads_highest_id(self):
+        """Test that max_faq_id asks MongoDB for the top id only."""
+        mock_collection = MagicMock()
+        mock_collection.find_one.return_value = {"id": 42}
+
+        with patch("src.agents.faq_agent._get_faq_collection", return_value=mock_collection):
+            assert max_faq_id() == 42
+
+        _, kwargs = mock_collection.find_one.call_args
+        assert kwargs["sort"] == [("id", -1)]
+
+    def test_max_faq_id_empty_collection(self):
+        """Test that max_faq_id returns 0 when there are no FAQs."""
+        mock_collection = MagicMock()
+        mock_collection.find_one.return_value = None
+
+        with patch("src.agents.faq_agent._get_faq_collection", return_value=mock_collection):
+            assert max_faq_id() == 0
+
+    def test_faq_lookup_reuses_cached_faqs(self, base_ticket_state, sample_faq_database):
+        """Test that consecutive lookups hit MongoDB only once."""
+        loader = MagicMock(return_value=sample_faq_database)
+
+        with patch("src.agents.faq_agent.load_faq_database", loader):
+            faq_lookup_agent(dict(base_ticket_state, conversation_history=[]))
+            faq_lookup_agent(dict(base_ticket_state, conversation_history=[]))
+
+        assert loader.call_count == 1
+
+    def test_invalidate_faq_cache_forces_reload(self, base_ticket_state, sample_faq_database):
+        """Test that invalidating the cache makes the next lookup reload."""
+        loader = MagicMock(return_value=sample_faq_database)
+
+        with patch("src.agents.faq_agent.load_faq_database", loader):
+            faq_lookup_agent(dict(base_ticket_state, conversation_history=[]))
+            invalidate_faq_cache()
+            faq_lookup_agent(dict(base_ticket_state, conversation_history=[]))
+
+        assert loader.call_count == 2
+
+    def test_faq_agent_leaves_conversation_history_alone(self, general_ticket_state, sample_faq_database, monkeypatch):
+        """Test that FAQ agent does not write history (the workflow merges its branch)."""
         general_ticket_state["conversation_history"] = ["[INTAKE] Customer asking about password"]
 
         monkeypatch.setattr(
@@ -110,32 +167,43 @@ class TestFAQAgent:
             lambda: sample_faq_database
         )
 
-        mock_chatgpt("Click 'Forgot Password' on the login page.")
-
         result = faq_lookup_agent(general_ticket_state)
 
-        assert len(result["conversation_history"]) == 2
-        assert "[INTAKE]" in result["conversation_history"][0]
-        assert "[FAQ]" in result["conversation_history"][1]
+        assert result["faq_match"] != ""
+        assert result["conversation_history"] == ["[INTAKE] Customer asking about password"]
+
+    def test_faq_agent_stores_long_answer_in_full(self, general_ticket_state, sample_faq_database, monkeypatch):
+        """Test that a long FAQ answer is stored untruncated in faq_match."""
+        long_answer = "A" * 200
+        sample_faq_database["faqs"][0]["answer"] = long_answer
 
-    def test_faq_agent_truncates_long_match_in_history(self, general_ticket_state, mock_chatgpt, sample_faq_database, monkeypatch):
-        """Test that very long FAQ matches are truncated in conversation history."""
         monkeypatch.setattr(
             "src.agents.faq_agent.load_faq_database",
             lambda: sample_faq_database
         )
 
-        long_response = "A" * 200
-        mock_chatgpt(long_response)
-
         result = faq_lookup_agent(general_ticket_state)
 
-        # Full match stored in state
-        assert len(result["faq_match"]) == 200
+        assert result["faq_match"] == long_answer
+
+    def test_faq_client_is_synchronous(self, monkeypatch):
+        """Test that the FAQ helpers use a sync pymongo client, not Motor."""
+        client_class = MagicMock()
+        monkeypatch.setattr(faq_agent, "MongoClient", client_class)
+        monkeypatch.setattr(faq_agent, "_client", None)
+
+        assert faq_agent._get_client() is client_class.return_value
+        client_class.assert_called_once()
+
+    def test_stream_faqs_iterates_cursor(self, sample_faq_database):
+        """Test that stream_faqs yields documents straight from the cursor."""
+        mock_collection = MagicMock()
+        mock_collection.find.return_value.sort.return_value = iter(sample_faq_database["faqs"])
+
+        with patch("src.agents.faq_agent._get_faq_collection", return_value=mock_collection):
+            ids = [faq["id"] for faq in stream_faqs()]
 
-        # History entry truncated to 100 chars + "..."
-        history_entry = result["conversation_history"][0]
-        assert "..." in history_entry
+        assert ids == [1, 2, 3, 4, 5]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""
+Tests for the FAQ id re-sequencer.
+"""
+
+import pytest
+from src.utils import faq_debug
+
+
+class _UniqueIdCollection:
+    """In-memory stand-in for a collection with a unique index on ``id``."""
+
+    def __init__(self, ids):
+        self.docs = {n: ({"_id": n, "id": i} if i is not None else {"_id": n}) for n, i in enumerate(ids)}
+        self.write_batches = 0
+
+    def find(self, *args, **kwargs):
+        return self
+
+    def sort(self, key, direction):
+        # MongoDB sorts a missing id first, like null
+        return sorted(
+            (dict(doc) for doc in self.docs.values()),
+            key=lambda doc: (key in doc, doc.get(key, 0))
+        )
+
+    def bulk_write(self, updates, ordered=True):
+        self.write_batches += 1
+        for flt, update in updates:
+            new_id = update["$set"]["id"]
+            clash = [d for d in self.docs.values() if d.get("id") == new_id and d["_id"] != flt["_id"]]
+            if clash:
+                raise RuntimeError(f"E11000 duplicate key: id {new_id}")
+            self.docs[flt["_id"]]["id"] = new_id
+
+    def ids(self):
+        return sorted(doc["id"] for doc in self.docs.values())
+
+
+@pytest.fixture(autouse=True)
+def _plain_update_one(monkeypatch):
+    """Record updates as (filter, update) pairs the stand-in can apply."""
+    monkeypatch.setattr(faq_debug, "UpdateOne", lambda flt, update: (flt, update))
+
+
+class TestResequenceIds:
+    """Test suite for resequence_ids."""
+
+    def test_missing_id_sorted_first_does_not_collide(self):
+        """Test that a doc without an id is renumbered without a duplicate-key error."""
+        collection = _UniqueIdCollection([None, 1, 2, 3])
+
+        moved = faq_debug.resequence_ids(collection)
+
+        assert collection.ids() == [1, 2, 3, 4]
+        assert moved == 4
+
+    def test_gaps_and_out_of_order_ids(self):
+        """Test that gapped ids are closed up in id order."""
+        collection = _UniqueIdCollection([7, 2, 5, 1])
+
+        faq_debug.resequence_ids(collection)
+
+        assert collection.ids() == [1, 2, 3, 4]
+        # Former id 7 sorts last, so it ends up as 4
+        assert collection.docs[0]["id"] == 4
+
+    def test_in_place_ids_are_not_rewritten(self):
+        """Test that an already contiguous sequence makes no writes."""
+        collection = _UniqueIdCollection([1, 2, 3])
+
+        assert faq_debug.resequence_ids(collection) == 0
+        assert collection.write_batches == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
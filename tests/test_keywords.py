@@ -0,0 +1,92 @@
+"""
+Tests for the shared keyword matcher.
+"""
+
+import pytest
+from src.utils.keywords import compile_keywords
+
+
+class TestCompileKeywords:
+    """Test suite for compile_keywords."""
+
+    @pytest.mark.parametrize("text", [
+        "i want to talk to a lawyer",
+        "this needs legal action now",
+        "please resolve this issue",  # substring match, same as `in`
+    ])
+    def test_matches_like_substring_any(self, text):
+        """Test that search() agrees with any(keyword in text)."""
+        keywords = ["lawyer", "legal action", "sue"]
+        pattern = compile_keywords(keywords)
+
+        assert bool(pattern.search(text)) == any(k in text for k in keywords)
+        assert pattern.search(text)
+
+    def test_matches_ignoring_case(self):
+        """Test that mixed-case text matches without lower-casing it first."""
+        pattern = compile_keywords(["legal action", "sue"], word_start=True)
+
+        assert pattern.search("We Are Taking LEGAL ACTION")
+        assert pattern.search("I will SUE")
+
+    def test_no_match(self):
+        """Test that unrelated text does not match."""
+        pattern = compile_keywords(["urgent", "critical"])
+
+        assert pattern.search("how do i reset my password?") is None
+
+    def test_special_characters_are_escaped(self):
+        """Test that regex metacharacters in keywords are matched literally."""
+        pattern = compile_keywords(["a+b"])
+
+        assert pattern.search("a+b")
+        assert pattern.search("aab") is None
+
+    def test_word_start_skips_embedded_matches(self):
+        """Test that word_start ignores keywords inside other words."""
+        pattern = compile_keywords(["sue", "legal action"], word_start=True)
+
+        assert pattern.search("i have an issue with my order") is None
+        assert pattern.search("we will pursue a fix") is None
+        assert pattern.search("i will sue you")
+        assert pattern.search("we are taking legal action.")
+
+    @pytest.mark.parametrize("text", [
+        "i have spoken to my lawyers",
+        "our attorneys will be in touch",
+        "expect legal actions from us",
+    ])
+    def test_word_start_keeps_plurals_and_inflections(self, text):
+        """Test that word_start still matches keywords with a suffix."""
+        pattern = compile_keywords(["lawyer", "attorney", "legal action"], word_start=True)
+
+        assert pattern.search(text)
+
+    @pytest.mark.parametrize("text", [
+        "the card was recharged",
+        "battery discharge is fine",
+        "she was a terror",
+    ])
+    def test_whole_word_skips_embedded_matches(self, text):
+        """Test that whole_word ignores keywords inside longer words."""
+        pattern = compile_keywords(["charge", "error"], whole_word=True)
+
+        assert pattern.search(text) is None
+
+    def test_whole_word_stems_take_suffixes(self):
+        """Test that a keyword ending in * matches any word it begins."""
+        pattern = compile_keywords(["freez*", "charge"], whole_word=True)
+
+        assert pattern.search("the app keeps FREEZING")
+        assert pattern.search("it freezes")
+        assert pattern.search("why the charge?")
+        assert pattern.search("i was charged") is None
+        assert pattern.search("antifreeze") is None
+
+    def test_empty_keyword_list_matches_nothing(self):
+        """Test that an empty keyword list never matches."""
+        assert compile_keywords([]).search("anything") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
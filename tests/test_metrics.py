@@ -0,0 +1,76 @@
+"""
+Tests for the in-memory ticket metrics.
+"""
+
+import threading
+
+import pytest
+from src.utils.metrics import TicketMetrics
+
+
+class TestTicketMetrics:
+    """Test suite for TicketMetrics."""
+
+    def test_response_time_aggregates(self):
+        """Test that average, min and max come from the running totals."""
+        metrics = TicketMetrics()
+        metrics.record_ticket("TECHNICAL", escalated=False, response_time=2.0)
+        metrics.record_ticket("BILLING", escalated=True, response_time=0.5)
+        metrics.record_ticket("BILLING", escalated=False, response_time=1.0)
+
+        data = metrics.get_metrics()
+
+        assert data["total_tickets"] == 3
+        assert data["escalated_tickets"] == 1
+        assert data["average_response_time"] == pytest.approx(3.5 / 3)
+        assert data["min_response_time"] == 0.5
+        assert data["max_response_time"] == 2.0
+        assert data["category_distribution"] == {"TECHNICAL": 1, "BILLING": 2}
+
+    def test_reset_clears_response_times(self):
+        """Test that reset() starts the aggregates from scratch."""
+        metrics = TicketMetrics()
+        metrics.record_ticket("GENERAL", escalated=False, response_time=5.0)
+
+        metrics.reset()
+        metrics.record_ticket("GENERAL", escalated=False, response_time=3.0)
+
+        data = metrics.get_metrics()
+        assert data["min_response_time"] == 3.0
+        assert data["max_response_time"] == 3.0
+        assert data["average_response_time"] == 3.0
+
+    def test_concurrent_record_ticket(self):
+        """Test that tickets recorded from many threads are all counted."""
+        metrics = TicketMetrics()
+
+        def record_many():
+            for _ in range(1000):
+                metrics.record_ticket("GENERAL", escalated=False, response_time=1.0)
+
+        threads = [threading.Thread(target=record_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = metrics.get_metrics()
+        assert data["total_tickets"] == 8000
+        assert data["category_distribution"] == {"GENERAL": 8000}
+
+    def test_pretty_rounds_rates_and_times(self):
+        """Test that pretty=True rounds to 2 decimals for display."""
+        metrics = TicketMetrics()
+        metrics.record_ticket("GENERAL", escalated=False, response_time=1.0)
+        metrics.record_ticket("GENERAL", escalated=False, response_time=1.0)
+        metrics.record_ticket("GENERAL", escalated=True, response_time=0.5)
+
+        data = metrics.get_metrics(pretty=True)
+
+        assert data["automation_rate"] == 66.67
+        assert data["escalation_rate"] == 33.33
+        assert data["average_response_time"] == 0.83
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -191,7 +191,6 @@ Support Team""")
         # Existing history
         resolved_ticket_state["conversation_history"] = [
             "[INTAKE] Customer inquiry",
-            "[FAQ] Match found",
             "[CLASSIFIER] Category: GENERAL",
             "[GENERAL] Resolution provided",
             "[ESCALATION] Cleared for automated response"
@@ -204,7 +203,7 @@ Support Team""")
         result = response_generator_agent(resolved_ticket_state)
 
         # Should have all entries
-        assert len(result["conversation_history"]) == 6
+        assert len(result["conversation_history"]) == 5
         assert "[RESPONSE] Final response generated" in result["conversation_history"][-1]
 
     def test_response_agent_professional_tone(self, resolved_ticket_state, mock_chatgpt):
@@ -271,6 +270,31 @@ Support Team""")
         # Should have empathetic tone
         assert result["final_response"] != ""
 
+    def test_response_agent_faq_answer_skips_llm(self, general_ticket_state, mock_chatgpt):
+        """Test that an FAQ hit without a resolution is answered without the LLM."""
+        general_ticket_state["faq_match"] = "Click 'Forgot Password' on the login page."
+        general_ticket_state["resolution"] = ""
+        mock_chatgpt("LLM SHOULD NOT BE USED")
+
+        result = response_generator_agent(general_ticket_state)
+
+        assert "Click 'Forgot Password' on the login page." in result["final_response"]
+        assert general_ticket_state["ticket_id"] in result["final_response"]
+        assert "LLM SHOULD NOT BE USED" not in result["final_response"]
+        assert result["conversation_history"][-1] == "[RESPONSE] Final response generated (FAQ)"
+
+    def test_response_agent_faq_direct_response_disabled(self, general_ticket_state, mock_chatgpt, monkeypatch):
+        """Test that FAQ answers go through the LLM when direct responses are off."""
+        monkeypatch.setattr("src.agents.response_agent.config.FAQ_DIRECT_RESPONSE", False)
+        general_ticket_state["faq_match"] = "Click 'Forgot Password' on the login page."
+        general_ticket_state["resolution"] = ""
+        mock_chatgpt("Dear Customer, here is how to reset your password.")
+
+        result = response_generator_agent(general_ticket_state)
+
+        assert result["final_response"] == "Dear Customer, here is how to reset your password."
+        assert result["conversation_history"][-1] == "[RESPONSE] Final response generated"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
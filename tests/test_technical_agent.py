@@ -90,7 +90,6 @@ Additional Notes: If problem persists, we may need to check server logs"""
         # Add existing history
         classified_ticket_state["conversation_history"] = [
             "[INTAKE] Customer reports crash",
-            "[FAQ] No match found",
             "[CLASSIFIER] Category: TECHNICAL"
         ]
 
@@ -101,7 +100,7 @@ Additional Notes: If problem persists, we may need to check server logs"""
         result = technical_support_agent(classified_ticket_state)
 
         # Should have all entries
-        assert len(result["conversation_history"]) == 4
+        assert len(result["conversation_history"]) == 3
         assert "[TECHNICAL] Resolution provided" in result["conversation_history"][-1]
 
     def test_technical_agent_complex_issue(self, classified_ticket_state, mock_chatgpt):
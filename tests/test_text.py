@@ -0,0 +1,47 @@
+"""
+Tests for the prompt text helpers.
+"""
+
+import pytest
+from src.utils.text import clip_text
+
+
+class TestClipText:
+    """Test suite for clip_text."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the limit is returned as-is."""
+        assert clip_text("Restart the app.", 100) == "Restart the app."
+
+    def test_cuts_at_sentence_end(self):
+        """Test that clipping prefers the last complete sentence."""
+        text = "Clear your cache. Then reinstall the app. Finally contact us if it persists."
+
+        assert clip_text(text, 45) == "Clear your cache. Then reinstall the app."
+
+    def test_falls_back_to_word_boundary(self):
+        """Test that a long first sentence is cut between words."""
+        text = "Please clear the application cache from the settings menu and restart"
+
+        result = clip_text(text, 30)
+
+        assert len(result) <= 30
+        assert text.startswith(result)
+        assert not result.endswith(" ")
+        assert text[len(result)] == " "
+
+    def test_early_break_is_not_used(self):
+        """Test that a break before half the budget gives way to a hard cut."""
+        text = "Hello world. " + "x" * 600
+
+        result = clip_text(text, 500)
+
+        assert result == text[:500]
+
+    def test_hard_cut_without_spaces(self):
+        """Test that text without breaks is cut at the limit."""
+        assert clip_text("A" * 50, 10) == "A" * 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
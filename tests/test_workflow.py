@@ -0,0 +1,75 @@
+"""
+Tests for the workflow helpers.
+
+Tests the concurrent intake + FAQ lookup stage, its state merge
+and category routing.
+"""
+
+import pytest
+from src import workflow
+
+
+def _fake_intake(state):
+    state["conversation_history"].append("[INTAKE] summary")
+    state["priority"] = "high"
+    state["category"] = "TECHNICAL"
+    return state
+
+
+class TestIntakeAndFAQ:
+    """Test suite for the intake_and_faq stage."""
+
+    def test_faq_hit_overrides_intake_category(self, base_ticket_state, monkeypatch):
+        """Test that an FAQ match and its category win over intake's guess."""
+        def fake_faq(state):
+            state["faq_match"] = "Click 'Forgot Password'."
+            state["category"] = "GENERAL"
+            return state
+
+        monkeypatch.setattr(workflow, "intake_agent", _fake_intake)
+        monkeypatch.setattr(workflow, "faq_lookup_agent", fake_faq)
+
+        result = workflow.intake_and_faq(base_ticket_state)
+
+        assert result["faq_match"] == "Click 'Forgot Password'."
+        assert result["category"] == "GENERAL"
+        assert result["priority"] == "high"
+        assert result["conversation_history"] == ["[INTAKE] summary"]
+
+    def test_faq_miss_keeps_intake_category(self, base_ticket_state, monkeypatch):
+        """Test that intake's category is kept when the FAQ lookup misses."""
+        def fake_faq(state):
+            state["faq_match"] = ""
+            return state
+
+        monkeypatch.setattr(workflow, "intake_agent", _fake_intake)
+        monkeypatch.setattr(workflow, "faq_lookup_agent", fake_faq)
+
+        result = workflow.intake_and_faq(base_ticket_state)
+
+        assert result["faq_match"] == ""
+        assert result["category"] == "TECHNICAL"
+
+
+class TestRouteByCategory:
+    """Test suite for route_by_category."""
+
+    @pytest.mark.parametrize("category, node", [
+        ("TECHNICAL", "technical_support"),
+        ("BILLING", "billing_support"),
+        ("GENERAL", "general_support"),
+        ("UNKNOWN", "general_support"),
+        ("", "general_support"),
+        # Unnormalised values from an LLM reply still reach their specialist
+        ("technical", "technical_support"),
+        (" BILLING\n", "billing_support"),
+    ])
+    def test_routes_each_category(self, base_ticket_state, category, node):
+        """Test that each category maps to its specialist node."""
+        base_ticket_state["category"] = category
+
+        assert workflow.route_by_category(base_ticket_state) == node
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])